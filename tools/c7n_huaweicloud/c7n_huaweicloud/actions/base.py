@@ -7,7 +7,7 @@ import logging
 import requests
 import socket
 from abc import ABC
-from retrying import retry
+from retrying import Retrying
 
 from c7n.actions import BaseAction
 from huaweicloudsdkcore.exceptions import exceptions
@@ -25,20 +25,37 @@ RETRYABLE_EXCEPTIONS = (
     requests.exceptions.RetryError,
 )
 
+# bad gateway and service unavailable are transient on the Huawei Cloud API,
+# the request was not processed
+RETRYABLE_SERVER_STATUS_CODES = (502, 503)
 
-def is_retryable_exception(e):
+# a gateway timeout may arrive after the request was processed, it is only
+# retried for idempotent calls
+IDEMPOTENT_RETRYABLE_SERVER_STATUS_CODES = RETRYABLE_SERVER_STATUS_CODES + (504,)
+
+
+def is_retryable_exception(e, server_status_codes=RETRYABLE_SERVER_STATUS_CODES):
     if isinstance(e, RETRYABLE_EXCEPTIONS):
         return True
     # 429 too many requests
     if isinstance(e, exceptions.ClientRequestException) and e.status_code == 429:
         return True
+    if isinstance(e, exceptions.ServerResponseException) and \
+            e.status_code in server_status_codes:
+        return True
 
     return False
 
 
+def is_idempotent_retryable_exception(e):
+    return is_retryable_exception(e, IDEMPOTENT_RETRYABLE_SERVER_STATUS_CODES)
+
+
 class HuaweiCloudBaseAction(BaseAction, ABC):
     failed_resources = []
     result = {"succeeded_resources": [], "failed_resources": failed_resources}
+    # idempotent actions opt in to also retry gateway timeouts
+    retry_server_errors = False
 
     def get_tag_client(self):
         return local_session(self.manager.session_factory).client("tms")
@@ -47,12 +64,17 @@ class HuaweiCloudBaseAction(BaseAction, ABC):
         self.result.get("succeeded_resources").extend(resources)
         return self.result
 
-    @retry(retry_on_exception=is_retryable_exception,
-           wait_exponential_multiplier=1000,
-           wait_exponential_max=10000,
-           stop_max_attempt_number=5)
     def process_action(self, resource):
-        self.perform_action(resource)
+        if self.retry_server_errors:
+            retry_on_exception = is_idempotent_retryable_exception
+        else:
+            retry_on_exception = is_retryable_exception
+        retrying = Retrying(retry_on_exception=retry_on_exception,
+                            wait_exponential_multiplier=1000,
+                            wait_exponential_max=10000,
+                            wait_jitter_max=1000,
+                            stop_max_attempt_number=5)
+        retrying.call(self.perform_action, resource)
 
     def process(self, resources):
         for resource in resources:
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 
 from dateutil import tz as tzutil
 from huaweicloudsdkcore.exceptions import exceptions
+from retrying import retry
 from huaweicloudsdkiam.v3 import KeystoneListProjectsRequest
 from huaweicloudsdktms.v1 import CreateResourceTagRequest, ReqCreateTag, ReqDeleteTag, \
     DeleteResourceTagRequest
@@ -17,6 +18,7 @@ from c7n.filters.offhours import Time
 from c7n.utils import type_schema, chunks, local_session
 
 from c7n_huaweicloud.actions import HuaweiCloudBaseAction
+from c7n_huaweicloud.actions.base import is_retryable_exception
 
 MAX_WORKERS = 5
 MAX_TAGS_SIZE = 10
@@ -102,10 +104,13 @@ class CreateResourceTagAction(HuaweiCloudBaseAction):
                      if "tag_resource_type" in resource.keys() and len(
                 resource['tag_resource_type']) > 0]
         self.log.debug("Start tag, tags:[%s], resources:[%s]", tags, resources)
-        for resource_batch in chunks(resources, RESOURCE_MAX_SIZE):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(self.process_resource_set, tms_client, resource_batch,
+                                       tags, project_id): resource_batch
+                       for resource_batch in chunks(resources, RESOURCE_MAX_SIZE)}
+        for future, resource_batch in futures.items():
             try:
-                failed_resources = self.process_resource_set(tms_client, resource_batch, tags,
-                                                             project_id)
+                failed_resources = future.result()
                 self.handle_exception(failed_resources=failed_resources, resources=resources)
             except exceptions.ClientRequestException as ex:
                 for failed_resource_res in resource_batch:
@@ -130,6 +135,11 @@ class CreateResourceTagAction(HuaweiCloudBaseAction):
         for failed_resource in failed_resources:
             resources.remove(failed_resource)
 
+    @retry(retry_on_exception=is_retryable_exception,
+           wait_exponential_multiplier=1000,
+           wait_exponential_max=10000,
+           wait_jitter_max=1000,
+           stop_max_attempt_number=5)
     def process_resource_set(self, client, resource_batch, tags, project_id):
         request_body = ReqCreateTag(project_id=project_id, resources=resource_batch, tags=tags)
         request = CreateResourceTagRequest(body=request_body)
@@ -236,10 +246,13 @@ class DeleteResourceTagAction(HuaweiCloudBaseAction):
                      if "tag_resource_type" in resource.keys() and len(
                 resource['tag_resource_type']) > 0]
         self.log.debug("Start remove-tag, tags:[%s], resources:[%s]", tags, resources)
-        for resource_batch in chunks(resources, RESOURCE_MAX_SIZE):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(self.process_resource_set, tms_client, resource_batch,
+                                       key_values, project_id): resource_batch
+                       for resource_batch in chunks(resources, RESOURCE_MAX_SIZE)}
+        for future, resource_batch in futures.items():
             try:
-                failed_resources = self.process_resource_set(tms_client, resource_batch, key_values,
-                                                             project_id)
+                failed_resources = future.result()
                 self.handle_exception(failed_resources=failed_resources, resources=resources)
             except exceptions.ClientRequestException as ex:
                 for failed_resource_res in resource_batch:
@@ -265,6 +278,11 @@ class DeleteResourceTagAction(HuaweiCloudBaseAction):
         for failed_resource in failed_resources:
             resources.remove(failed_resource)
 
+    @retry(retry_on_exception=is_retryable_exception,
+           wait_exponential_multiplier=1000,
+           wait_exponential_max=10000,
+           wait_jitter_max=1000,
+           stop_max_attempt_number=5)
     def process_resource_set(self, client, resource_batch, tags, project_id):
         request_body = ReqDeleteTag(project_id=project_id, resources=resource_batch, tags=tags)
         request = DeleteResourceTagRequest(body=request_body)
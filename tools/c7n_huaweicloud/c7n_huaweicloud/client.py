@@ -14,6 +14,7 @@ from huaweicloudsdkconfig.v1 import ConfigClient, ShowTrackerConfigRequest
 from huaweicloudsdkconfig.v1.region.config_region import ConfigRegion
 from huaweicloudsdkcore.auth.credentials import BasicCredentials, GlobalCredentials
 from huaweicloudsdkcore.auth.provider import MetadataCredentialProvider
+from huaweicloudsdkcore.http.http_config import HttpConfig
 from huaweicloudsdkecs.v2 import EcsClient, ListServersDetailsRequest
 from huaweicloudsdkecs.v2.region.ecs_region import EcsRegion
 from huaweicloudsdkbms.v1 import BmsClient, ListBareMetalServerDetailsRequest
@@ -188,6 +189,11 @@ from huaweicloudsdkdns.v2 import (
 
 log = logging.getLogger("custodian.huaweicloud.client")
 
+# RDS actions call the API from up to 16 threads (rds.MAX_WORKERS), keep that
+# many keep-alive connections pooled instead of the SDK default of 10 so the
+# extra ones are not closed and re-handshaken after every request
+RDS_POOL_MAXSIZE = 16
+
 
 class Session:
     """Session"""
@@ -566,8 +572,11 @@ class Session:
                 .build()
             )
         elif service == "rds":
+            http_config = HttpConfig.get_default_config()
+            http_config.pool_maxsize = RDS_POOL_MAXSIZE
             client = (
                 RdsClient.new_builder()
+                .with_http_config(http_config)
                 .with_credentials(credentials)
                 .with_region(RdsRegion.value_of(self.region))
                 .build()
@@ -858,7 +867,7 @@ class Session:
         elif service == "dns":
             request = ListPublicZonesRequest()
         elif service == "rfs":
-            request = ListStacksRequest(client_request_id=str(uuid.uuid1()))
+            request = ListStacksRequest(client_request_id=str(uuid.uuid4()))
         return request
 
 
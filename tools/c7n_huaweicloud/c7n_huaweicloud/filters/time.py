@@ -19,6 +19,29 @@ def register_time_filters(filters):
     filters.register('resource-time', ResourceTimeFilter)
 
 
+class IsoDateAgeFilter(AgeFilter):
+    """Age filter reading ISO-8601 resource dates with datetime.fromisoformat.
+
+    fromisoformat is much cheaper than the dateutil parser AgeFilter uses,
+    values it rejects (e.g. "2024-07-02T10:00:00Z+0800") still go through
+    dateutil so their meaning does not change.
+    """
+
+    def get_resource_date(self, i):
+        v = i.get(self.date_attribute)
+        if not isinstance(v, str):
+            return super().get_resource_date(i)
+        if v.endswith("Z"):
+            v = v[:-1] + "+00:00"
+        try:
+            v = datetime.fromisoformat(v)
+        except ValueError:
+            return super().get_resource_date(i)
+        if not v.tzinfo:
+            v = v.replace(tzinfo=tzutc())
+        return v
+
+
 class ResourceTimeFilter(AgeFilter):
     """
     Filter resources by resource time.
@@ -6,10 +6,11 @@ import jmespath
 import sys
 import http.client
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from retrying import retry
 
 from c7n.actions import ActionRegistry
-from c7n.filters import FilterRegistry
+from c7n.filters import FilterRegistry, ValueFilter
 from c7n.manager import ResourceManager
 from c7n.query import sources, MaxResourceLimit
 from c7n.utils import local_session
@@ -31,6 +32,13 @@ log = logging.getLogger("custodian.huaweicloud.query")
 DEFAULT_LIMIT_SIZE = 100
 DEFAULT_MAXITEMS_SIZE = 400
 
+# value filter sentinels that can never be expressed as a list request parameter
+VALUE_FILTER_SENTINELS = ("absent", "present", "not-null", "empty")
+# policy limits checked against the number of resources listed
+RESOURCE_LIMIT_KEYS = ("max-resources", "max-resources-percent")
+# the only keys a value filter may carry to be expressed as a list request parameter
+SERVER_SIDE_FILTER_KEYS = {"type", "key", "value", "op"}
+
 RETRYABLE_EXCEPTIONS = (
     http.client.ResponseNotReady,
     http.client.IncompleteRead,
@@ -80,7 +88,8 @@ class ResourceQuery:
             if pagination == "ims":
                 resources = self._pagination_ims(m, enum_op, path)
             elif pagination == "offset":
-                resources = self._pagination_limit_offset(m, enum_op, path, limit)
+                resources = self._pagination_limit_offset(
+                    m, enum_op, path, limit, params.get("request_params"))
             elif pagination == "start_number":
                 resources = self._pagination_limit_start_number(m, enum_op, path, limit)
             elif pagination == "marker":
@@ -103,7 +112,7 @@ class ResourceQuery:
             log.error(f"[pagination]-[{enum_op}] Failed to get resources. Exception: {e}")
             raise e
 
-    def _pagination_limit_offset(self, m, enum_op, path, limit):
+    def _pagination_limit_offset(self, m, enum_op, path, limit, request_params=None):
 
         session = local_session(self.session_factory)
         client = session.client(m.service)
@@ -112,13 +121,13 @@ class ResourceQuery:
         if hasattr(m, "offset_start_num"):
             offset = m.offset_start_num
         limit = limit or DEFAULT_LIMIT_SIZE
+        # resource types whose list response carries total_count may set
+        # page_workers to fetch the remaining pages concurrently
+        page_workers = getattr(m, "page_workers", None)
         resources = []
         while 1:
-            request = session.request(m.service)
-            request.limit = limit
-            request.offset = offset
-            response = self._invoke_client_enum(client, enum_op, request)
-            res = jmespath.search(path, safe_json_parse(response))
+            response, res = self._fetch_offset_page(
+                session, client, m, enum_op, path, limit, offset, request_params)
 
             if path == "*":
                 data_json = json.loads(str(response))
@@ -126,19 +135,45 @@ class ResourceQuery:
                 resources.append(data_json)
                 return resources
 
-            # replace id with the specified one
-            if res is not None:
-                for data in res:
-                    data["id"] = data[m.id]
-                    data["tag_resource_type"] = m.tag_resource_type
-
-            resources = resources + res
-            if len(res) == limit:
-                offset += limit
-            else:
+            # extend in place, concatenating would copy every page fetched so far
+            resources.extend(res)
+            if len(res) != limit:
                 return resources
+            offset += limit
+
+            total_count = getattr(response, "total_count", None)
+            if page_workers and total_count and offset < total_count:
+                offsets = range(offset, total_count, limit)
+                with ThreadPoolExecutor(max_workers=page_workers) as w:
+                    pages = list(w.map(
+                        lambda o: self._fetch_offset_page(
+                            session, client, m, enum_op, path, limit, o, request_params)[1],
+                        offsets))
+                for res in pages:
+                    resources.extend(res)
+                # the listing may have grown while the pages were fetched
+                if len(pages[-1]) != limit:
+                    return resources
+                offset = offsets[-1] + limit
         return resources
 
+    def _fetch_offset_page(self, session, client, m, enum_op, path, limit, offset,
+                           request_params=None):
+        request = session.request(m.service)
+        request.limit = limit
+        request.offset = offset
+        for k, v in (request_params or {}).items():
+            setattr(request, k, v)
+        response = self._invoke_client_enum(client, enum_op, request)
+        res = jmespath.search(path, safe_json_parse(response))
+
+        # replace id with the specified one
+        if res is not None and path != "*":
+            for data in res:
+                data["id"] = data[m.id]
+                data["tag_resource_type"] = m.tag_resource_type
+        return response, res
+
     def _pagination_limit_start_number(self, m, enum_op, path, limit):
         """Process API pagination using start_number parameter
 
@@ -542,10 +577,17 @@ class QueryResourceManager(ResourceManager, metaclass=QueryMeta):
         return self.resource_type
 
     def get_cache_key(self, query):
+        # region and agency are part of the key so a shared --cache-period cache
+        # never hands one region's or account's resources to another, the
+        # resource class keeps types of one service (e.g. the secmaster
+        # workspace, alert and playbook listings) apart
         return {
+            "region": self.config.get("region"),
+            "agency_urn": self.config.get("agency_urn"),
             "source_type": self.source_type,
             "query": query,
             "service": self.resource_type.service,
+            "resource": self.__class__.__name__,
         }
 
     def get_resource(self, resource_info):
@@ -566,8 +608,49 @@ class QueryResourceManager(ResourceManager, metaclass=QueryMeta):
         return self.data.get("source", "describe-huaweicloud")
 
     def get_resource_query(self):
+        query = None
         if "query" in self.data:
-            return {"filter": self.data.get("query")}
+            query = {"filter": self.data.get("query")}
+        request_params = self.get_request_params()
+        if request_params:
+            query = dict(query or {}, request_params=request_params)
+        return query
+
+    def get_request_params(self):
+        """Map top level equality value filters onto list request parameters.
+
+        resource_type.server_side_filters maps a resource key to the list
+        request attribute the service filters on. The value filters still run
+        client side, so a server side match only has to be a superset. Filters
+        that transform the resource value or compare against anything but a
+        plain value (value_regex, value_from, value_type, ...) are never pushed
+        down, the server would compare against the raw value.
+        """
+        server_side_filters = getattr(self.resource_type, "server_side_filters", None)
+        if not server_side_filters:
+            return {}
+        # max-resources(-percent) are measured against the full population,
+        # a server side filtered listing would shrink it
+        if any(limit in self.data for limit in RESOURCE_LIMIT_KEYS):
+            return {}
+        params = {}
+        for f in self.filters:
+            if type(f) is not ValueFilter:
+                continue
+            data = f.data
+            if "type" not in data and len(data) == 1:
+                key, value = next(iter(data.items()))
+            elif data.get("type") == "value" \
+                    and set(data) <= SERVER_SIDE_FILTER_KEYS \
+                    and data.get("op", "eq") in ("eq", "equal"):
+                key, value = data.get("key"), data.get("value")
+            else:
+                continue
+            if key not in server_side_filters or not isinstance(value, str) \
+                    or value in VALUE_FILTER_SENTINELS:
+                continue
+            params[server_side_filters[key]] = value
+        return params
 
     def resources(self, query=None):
         q = query or self.get_resource_query()
@@ -608,6 +691,20 @@ class QueryResourceManager(ResourceManager, metaclass=QueryMeta):
         return resources
 
 
+class SharedClientMixin:
+    """Build the SDK client of a resource manager once.
+
+    The filters, actions and concurrent workers of a policy then share one
+    client, and with it one pool of keep-alive connections.
+    """
+
+    def get_client(self):
+        client = getattr(self, "_client", None)
+        if client is None:
+            client = self._client = super().get_client()
+        return client
+
+
 class TypeMeta(type):
     def __repr__(cls):
         return "<TypeInfo service:%s>" % (cls.service)
@@ -1,15 +1,18 @@
 # Copyright The Cloud Custodian Authors.
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
 import time
 import logging
+from concurrent.futures import as_completed
+
 from c7n.filters import Filter
 from c7n.filters.core import OPERATORS, type_schema
 from c7n.utils import local_session
 from c7n.exceptions import PolicyExecutionError
 from c7n_huaweicloud.actions.base import HuaweiCloudBaseAction
 from c7n_huaweicloud.provider import resources
-from c7n_huaweicloud.query import QueryResourceManager, TypeInfo
+from c7n_huaweicloud.query import QueryResourceManager, SharedClientMixin, TypeInfo
 
 from huaweicloudsdkrds.v3 import (
     SetSecurityGroupRequest, SwitchSslRequest,
@@ -30,23 +33,31 @@ from huaweicloudsdkcore.exceptions import exceptions
 
 log = logging.getLogger("custodian.huaweicloud.resources.rds")
 
+MAX_WORKERS = 16
 
-# Define a local TagEntity class to simplify tag operations
-class TagEntity:
-    """Simple tag structure to represent key-value pairs"""
+# Operator names accepted by filters comparing against a configured value
+_OP_KEYS = list(OPERATORS)
 
-    def __init__(self, key, value=None):
-        """
-        Initialize a tag entity
-        :param key: Tag key (required)
-        :param value: Tag value (optional)
-        """
-        self.key = key
-        self.value = value
+# Annotation holding the lower-case datastore type of an instance
+ENGINE_ANNOTATION = 'c7n:engine'
+
+
+def _get_engine(resource):
+    """Return the lower-case datastore type of an RDS instance
+
+    The value is computed once and cached on the resource, engine names are
+    interned so comparing them in filter loops is an identity check.
+    """
+    engine = resource.get(ENGINE_ANNOTATION)
+    if engine is None:
+        datastore = resource.get('datastore') or {}
+        engine = resource[ENGINE_ANNOTATION] = sys.intern(
+            (datastore.get('type') or '').lower())
+    return engine
 
 
 @resources.register('rds')
-class RDS(QueryResourceManager):
+class RDS(SharedClientMixin, QueryResourceManager):
     """Huawei Cloud RDS Resource Manager
 
     Used to manage instances in the Huawei Cloud Relational Database Service.
@@ -74,6 +85,61 @@ class RDS(QueryResourceManager):
         date = 'created'
         taggable = True
         tag_resource_type = 'rds'
+        # list_instances returns total_count, pages after the first are
+        # fetched concurrently
+        page_workers = 4
+        # resource keys list_instances can filter on, see get_request_params
+        server_side_filters = {
+            'id': 'id',
+            'name': 'name',
+            'type': 'type',
+            'datastore.type': 'datastore_type',
+            'vpc_id': 'vpc_id',
+            'subnet_id': 'subnet_id',
+        }
+
+    def augment(self, resources):
+        for r in resources:
+            _get_engine(r)
+        return resources
+
+
+class RDSBaseAction(HuaweiCloudBaseAction):
+    """Base class for RDS instance actions
+
+    Instances are dispatched concurrently, the number of parallel API calls
+    is bounded by the ``max_workers`` option of the action.
+    """
+
+    def process(self, resources):
+        # Resolve the client once for the whole batch, perform_action uses it
+        # for every instance instead of asking the manager again per row
+        self.client = self.manager.get_client()
+        if not resources:
+            return self.process_result(resources)
+        # No point in starting more threads than there are instances
+        max_workers = min(self.data.get('max_workers', MAX_WORKERS), len(resources))
+        failed_resources = []
+        with self.executor_factory(max_workers=max_workers) as w:
+            futures = {w.submit(self.process_action, resource): resource
+                       for resource in resources}
+            for f in as_completed(futures):
+                try:
+                    f.result()
+                except exceptions.ClientRequestException:
+                    # The error is logged by perform_action, keep processing
+                    # the remaining instances
+                    failed_resources.append(futures[f])
+                except Exception as e:
+                    # Server errors left after the retries, connection errors
+                    # or bugs must not abort the aggregation either
+                    log.error("Failed to process RDS instance %s: %s", futures[f]['id'], e)
+                    failed_resources.append(futures[f])
+        if failed_resources:
+            raise PolicyExecutionError(
+                "Failed to process RDS instances: %s" %
+                ", ".join(resource['id'] for resource in failed_resources))
+        return self.process_result(resources)
 
 
 @RDS.filter_registry.register('rds-list')
@@ -123,12 +189,19 @@ class DiskAutoExpansionFilter(Filter):
     )
 
     def process(self, resources, event=None):
+        if not resources:
+            return resources
         enabled = self.data.get('enabled', True)
-        client = local_session(self.manager.session_factory).client("rds")
+        client = self.manager.get_client()
         matched_resources = []
+        seen = set()
 
         for resource in resources:
             instance_id = resource['id']
+            # Skip instances passed more than once to avoid duplicate API calls
+            if instance_id in seen:
+                continue
+            seen.add(instance_id)
             try:
                 # Query instance disk auto-expansion policy
                 # API Documentation: https://support.huaweicloud.com/api-rds/rds_05_0027.html
@@ -145,8 +218,8 @@ class DiskAutoExpansionFilter(Filter):
                     matched_resources.append(resource)
             except Exception as e:
                 self.log.error(
-                    f"Failed to get auto-expansion policy for RDS instance {resource['name']} "
-                    f"(ID: {instance_id}): {e}")
+                    "Failed to get auto-expansion policy for RDS instance %s (ID: %s): %s",
+                    resource['name'], instance_id, e)
                 # If the auto-expansion policy cannot be obtained, assume it is not enabled
                 if not enabled:
                     matched_resources.append(resource)
@@ -174,7 +247,9 @@ class DatabaseVersionFilter(Filter):
     )
 
     def process(self, resources, event=None):
-        client = local_session(self.manager.session_factory).client("rds")
+        if not resources:
+            return resources
+        client = self.manager.get_client()
         database_name = self.data.get('database_name', 'mysql').lower()
 
         # Get the latest minor version information for all database versions
@@ -200,22 +275,20 @@ class DatabaseVersionFilter(Filter):
                             datastore.name, latest_versions[major_version]) > 0:
                         latest_versions[major_version] = datastore.name
 
-            self.log.debug(f"Get the latest minor versions for each major version "
-                           f"of the {database_name} engine: {latest_versions}")
+            self.log.debug("Get the latest minor versions for each major version "
+                           "of the %s engine: %s", database_name, latest_versions)
         except Exception as e:
-            self.log.error(f"Failed to get the version list of the "
-                           f"database engine {database_name}: {e}")
+            self.log.error("Failed to get the version list of the "
+                           "database engine %s: %s", database_name, e)
             raise
 
         # Filter out instances that are not the latest minor version
         outdated_resources = []
         for resource in resources:
-            datastore = resource.get('datastore', {})
-            resource_type = datastore.get('type', '').lower()
-
             # Skip mismatched database types
-            if resource_type != database_name:
+            if _get_engine(resource) != database_name:
                 continue
+            datastore = resource.get('datastore', {})
 
             # Get the major version number from the complete version number
             complete_version = datastore.get('complete_version', datastore.get('version', ''))
@@ -246,13 +319,14 @@ class DatabaseVersionFilter(Filter):
                 if self._compare_versions(instance_version_to_compare,
                                           latest_version_to_compare) < 0:
                     self.log.debug(
-                        f"Instance {resource['name']} version"
-                        f" {complete_version} is not the latest minor version {latest_version}")
+                        "Instance %s version"
+                        " %s is not the latest minor version %s",
+                        resource['name'], complete_version, latest_version)
                     outdated_resources.append(resource)
             else:
                 self.log.debug(
-                    f"Cannot find the latest minor version corresponding to the "
-                    f"main version {major_version} of instance {resource['name']}")
+                    "Cannot find the latest minor version corresponding to the "
+                    "main version %s of instance %s", major_version, resource['name'])
         return outdated_resources
 
     def _compare_versions(self, version1, version2):
@@ -333,7 +407,9 @@ class AuditLogDisabledFilter(Filter):
         keep_days={'type': 'integer', 'minimum': 1, 'maximum': 3660})
 
     def process(self, resources, event=None):
-        client = local_session(self.manager.session_factory).client("rds")
+        if not resources:
+            return resources
+        client = self.manager.get_client()
         matched_resources = []
         log_group_name = self.data.get('log_group_name')
         log_topic_name = self.data.get('log_topic_name')
@@ -346,8 +422,13 @@ class AuditLogDisabledFilter(Filter):
                                                  log_group_name, log_topic_name
                                                  )
 
+        seen = set()
         for resource in resources:
             instance_id = resource['id']
+            # Skip instances passed more than once to avoid duplicate API calls
+            if instance_id in seen:
+                continue
+            seen.add(instance_id)
             try:
                 request = ShowAuditlogPolicyRequest()
                 request.instance_id = instance_id
@@ -360,7 +441,7 @@ class AuditLogDisabledFilter(Filter):
                     continue
 
                 request = ListLogLtsConfigsRequest()
-                request.engine = resource['datastore'].get("type").lower()
+                request.engine = _get_engine(resource)
                 request.instance_id = instance_id
                 response = client.list_log_lts_configs(request)
 
@@ -378,8 +459,8 @@ class AuditLogDisabledFilter(Filter):
 
             except Exception as e:
                 self.log.error(
-                    f"Get the audit log policy of RDS instance {resource['name']} "
-                    f"(ID: {instance_id}) failed: {e}")
+                    "Get the audit log policy of RDS instance %s "
+                    "(ID: %s) failed: %s", resource['name'], instance_id, e)
                 raise
 
         return matched_resources
@@ -402,11 +483,18 @@ class BackupPolicyDisabledFilter(Filter):
     schema = type_schema('backup-policy-disabled')
 
     def process(self, resources, event=None):
-        client = local_session(self.manager.session_factory).client("rds")
+        if not resources:
+            return resources
+        client = self.manager.get_client()
         matched_resources = []
+        seen = set()
 
         for resource in resources:
             instance_id = resource['id']
+            # Skip instances passed more than once to avoid duplicate API calls
+            if instance_id in seen:
+                continue
+            seen.add(instance_id)
             try:
                 # Query instance backup policy
                 # API Document: https://support.huaweicloud.com/api-rds/rds_09_0003.html
@@ -424,8 +512,8 @@ class BackupPolicyDisabledFilter(Filter):
                     matched_resources.append(resource)
             except Exception as e:
                 self.log.error(
-                    f"Failed to get backup policy for RDS instance "
-                    f"{resource['name']} (ID: {instance_id}): {e}")
+                    "Failed to get backup policy for RDS instance "
+                    "%s (ID: %s): %s", resource['name'], instance_id, e)
                 # If the backup policy cannot be obtained, assume it is not enabled
                 matched_resources.append(resource)
 
@@ -458,11 +546,13 @@ class InstanceParameterFilter(Filter):
             {'type': 'integer'},
             {'type': 'boolean'}
         ]},
-        op={'enum': list(OPERATORS.keys()), 'default': 'eq'}
+        op={'enum': _OP_KEYS, 'default': 'eq'}
     )
 
     def process(self, resources, event=None):
-        client = local_session(self.manager.session_factory).client("rds")
+        if not resources:
+            return resources
+        client = self.manager.get_client()
         param_name = self.data.get('name')
         param_value = self.data.get('value')
         op_name = self.data.get('op', 'eq')
@@ -499,18 +589,18 @@ class InstanceParameterFilter(Filter):
 
                 if not found:
                     self.log.debug(
-                        f"RDS instance {resource['name']} (ID: {instance_id}) "
-                        f"does not have parameter {param_name}")
+                        "RDS instance %s (ID: %s) "
+                        "does not have parameter %s", resource['name'], instance_id, param_name)
             except Exception as e:
                 self.log.error(
-                    f"Failed to get the parameter template for RDS instance "
-                    f"{resource['name']} (ID: {instance_id}): {e}")
+                    "Failed to get the parameter template for RDS instance "
+                    "%s (ID: %s): %s", resource['name'], instance_id, e)
 
         return matched_resources
 
 
 @RDS.action_registry.register('set-security-group')
-class SetSecurityGroupAction(HuaweiCloudBaseAction):
+class SetSecurityGroupAction(RDSBaseAction):
     """Modify the security group of an RDS instance
 
     :example:
@@ -531,12 +621,14 @@ class SetSecurityGroupAction(HuaweiCloudBaseAction):
     schema = type_schema(
         'set-security-group',
         required=['security_group_id'],
-        security_group_id={'type': 'string'}
+        security_group_id={'type': 'string'},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
         security_group_id = self.data['security_group_id']
 
         try:
@@ -547,17 +639,17 @@ class SetSecurityGroupAction(HuaweiCloudBaseAction):
             }
             request.body = request_body
             response = client.set_security_group(request)
-            self.log.info(f"Successfully set security group for RDS instance "
-                          f"{resource['name']} (ID: {instance_id})")
+            self.log.info("Successfully set security group for RDS instance "
+                          "%s (ID: %s)", name, instance_id)
             return response
         except exceptions.ClientRequestException as e:
-            self.log.error(f"Failed to set security group for RDS instance "
-                           f"{resource['name']} (ID: {instance_id}): {e}")
+            self.log.error("Failed to set security group for RDS instance "
+                           "%s (ID: %s): %s", name, instance_id, e)
             raise
 
 
 @RDS.action_registry.register('switch-ssl')
-class SwitchSSLAction(HuaweiCloudBaseAction):
+class SwitchSSLAction(RDSBaseAction):
     """Enable or disable SSL encryption for the RDS instance,
     only supports MySQL, pg through modifying parameters to control
 
@@ -579,12 +671,14 @@ class SwitchSSLAction(HuaweiCloudBaseAction):
     schema = type_schema(
         'switch-ssl',
         required=['ssl_option'],
-        ssl_option={'type': 'boolean'}
+        ssl_option={'type': 'boolean'},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
         ssl_option = self.data['ssl_option']
 
         try:
@@ -597,18 +691,20 @@ class SwitchSSLAction(HuaweiCloudBaseAction):
             request.body = request_body
             response = client.switch_ssl(request)
             self.log.info(
-                f"Successfully {'enabled' if ssl_option else 'disabled'} "
-                f"SSL encryption for RDS instance {resource['name']} (ID: {instance_id})")
+                "Successfully %s "
+                "SSL encryption for RDS instance %s (ID: %s)",
+                'enabled' if ssl_option else 'disabled', name, instance_id)
             return response
         except exceptions.ClientRequestException as e:
             self.log.error(
-                f"Failed to {'enable' if ssl_option else 'disable'} "
-                f"SSL encryption for RDS instance {resource['name']} (ID: {instance_id}): {e}")
+                "Failed to %s "
+                "SSL encryption for RDS instance %s (ID: %s): %s",
+                'enable' if ssl_option else 'disable', name, instance_id, e)
             raise
 
 
 @RDS.action_registry.register('update-port')
-class UpdatePortAction(HuaweiCloudBaseAction):
+class UpdatePortAction(RDSBaseAction):
     """Modify the port of the RDS instance
 
     :example:
@@ -629,12 +725,14 @@ class UpdatePortAction(HuaweiCloudBaseAction):
     schema = type_schema(
         'update-port',
         required=['port'],
-        port={'type': 'integer', 'minimum': 1, 'maximum': 65535}
+        port={'type': 'integer', 'minimum': 1, 'maximum': 65535},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
         port = self.data['port']
 
         try:
@@ -646,17 +744,17 @@ class UpdatePortAction(HuaweiCloudBaseAction):
             request.instance_id = instance_id
             request.body = request_body
             response = client.update_port(request)
-            self.log.info(f"Successfully updated port for RDS instance "
-                          f"{resource['name']} (ID: {instance_id}) to {port}")
+            self.log.info("Successfully updated port for RDS instance "
+                          "%s (ID: %s) to %s", name, instance_id, port)
             return response
         except exceptions.ClientRequestException as e:
-            self.log.error(f"Failed to update port for RDS instance "
-                           f"{resource['name']} (ID: {instance_id}): {e}")
+            self.log.error("Failed to update port for RDS instance "
+                           "%s (ID: %s): %s", name, instance_id, e)
             raise
 
 
 @RDS.action_registry.register('set-auto-enlarge-policy')
-class SetAutoEnlargePolicyAction(HuaweiCloudBaseAction):
+class SetAutoEnlargePolicyAction(RDSBaseAction):
     """Set the autoEnlarge policy for the RDS instance
 
     :example:
@@ -682,43 +780,49 @@ class SetAutoEnlargePolicyAction(HuaweiCloudBaseAction):
         switch_option={'type': 'boolean'},
         limit_size={'type': 'integer', 'minimum': 40, 'maximum': 4000},
         trigger_threshold={'type': 'integer', 'minimum': 5, 'maximum': 15},
-        step_percent={'type': 'integer', 'minimum': 5, 'maximum': 100}
+        step_percent={'type': 'integer', 'minimum': 5, 'maximum': 100},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
-    def perform_action(self, resource):
-        client = self.manager.get_client()
-        instance_id = resource['id']
-        switch_option = self.data['switch_option']
-
-        if switch_option:
-            body = CustomerModifyAutoEnlargePolicyReq(
-                switch_option=switch_option,
+    def process(self, resources):
+        # The policy is the same for every instance, build the body once
+        if self.data['switch_option']:
+            self.request_body = CustomerModifyAutoEnlargePolicyReq(
+                switch_option=self.data['switch_option'],
                 limit_size=self.data['limit_size'],
                 trigger_threshold=self.data['trigger_threshold'],
                 step_percent=self.data['step_percent'],
             )
         else:
-            body = CustomerModifyAutoEnlargePolicyReq(
-                switch_option=switch_option,
+            self.request_body = CustomerModifyAutoEnlargePolicyReq(
+                switch_option=self.data['switch_option'],
             )
+        return super().process(resources)
 
-        request = SetAutoEnlargePolicyRequest(instance_id=instance_id, body=body)
+    def perform_action(self, resource):
+        client = self.client
+        instance_id = resource['id']
+        name = resource['name']
+        switch_option = self.data['switch_option']
+
+        request = SetAutoEnlargePolicyRequest(instance_id=instance_id, body=self.request_body)
 
         try:
             response = client.set_auto_enlarge_policy(request)
             self.log.info(
-                f"Successfully {'enabled' if switch_option else 'disabled'} "
-                f"autoEnlarge policy for RDS instance {resource['name']} (ID: {instance_id})")
+                "Successfully %s "
+                "autoEnlarge policy for RDS instance %s (ID: %s)",
+                'enabled' if switch_option else 'disabled', name, instance_id)
             return response
         except exceptions.ClientRequestException as e:
             self.log.error(
-                f"Failed to set autoEnlarge policy for RDS instance "
-                f"{resource['name']} (ID: {instance_id}): {e}")
+                "Failed to set autoEnlarge policy for RDS instance "
+                "%s (ID: %s): %s", name, instance_id, e)
             raise
 
 
 @RDS.action_registry.register('attach-eip')
-class AttachEIPAction(HuaweiCloudBaseAction):
+class AttachEIPAction(RDSBaseAction):
     """Bind or unbind the EIP for the RDS instance
 
     :example:
@@ -743,12 +847,14 @@ class AttachEIPAction(HuaweiCloudBaseAction):
         required=['is_bind'],
         is_bind={'type': 'boolean'},
         public_ip={'type': 'string'},
-        public_ip_id={'type': 'string'}
+        public_ip_id={'type': 'string'},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
         is_bind = self.data['is_bind']
         public_ip = self.data.get('public_ip')
         public_ip_id = self.data.get('public_ip_id')
@@ -770,18 +876,19 @@ class AttachEIPAction(HuaweiCloudBaseAction):
             request.body = request_body
             response = client.attach_eip(request)
             self.log.info(
-                f"Successfully {'bound' if is_bind else 'unbound'} EIP for RDS instance "
-                f"{resource['name']} (ID: {instance_id})")
+                "Successfully %s EIP for RDS instance "
+                "%s (ID: %s)", 'bound' if is_bind else 'unbound', name, instance_id)
             return response
         except exceptions.ClientRequestException as e:
             self.log.error(
-                f"Failed to {'bind' if is_bind else 'unbind'} EIP for RDS instance "
-                f"{resource['name']} (ID: {instance_id}): {e}")
+                "Failed to %s EIP for RDS instance "
+                "%s (ID: %s): %s",
+                'bind' if is_bind else 'unbind', name, instance_id, e)
             raise
 
 
 @RDS.action_registry.register('upgrade-db-version')
-class UpgradeDBVersionAction(HuaweiCloudBaseAction):
+class UpgradeDBVersionAction(RDSBaseAction):
     """Upgrade the RDS instance to a minor version
 
     :example:
@@ -805,15 +912,67 @@ class UpgradeDBVersionAction(HuaweiCloudBaseAction):
         'upgrade-db-version',
         is_delayed={'type': 'boolean'},
         target_version={'type': 'string'},
-        set_backup={'type': 'boolean'}
+        set_backup={'type': 'boolean'},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
-    def perform_action(self, resource):
+    def process(self, resources):
+        # The upgrade body only depends on the engine, so the target version is
+        # resolved and the body built once per engine instead of per instance
         client = self.manager.get_client()
-        instance_id = resource['id']
-        is_delayed = self.data.get('is_delayed', False)
+        self.request_bodies = {}
+        for resource in resources:
+            database_name = self._get_database_name(resource)
+            if database_name not in self.request_bodies:
+                self.request_bodies[database_name] = self._build_request_body(
+                    client, database_name)
+        return super().process(resources)
+
+    @staticmethod
+    def _get_database_name(resource):
+        return _get_engine(resource) or 'mysql'
+
+    def _build_request_body(self, client, database_name):
         target_version = self.data.get('target_version')
-        set_backup = self.data.get('set_backup', False)
+
+        # Set upgrade parameters
+        upgrade_req = CustomerUpgradeDatabaseVersionReqNew()
+        upgrade_req.is_delayed = self.data.get('is_delayed', False)
+
+        # If a target version is specified, set the target version
+        if target_version:
+            # First, get the list of available versions
+            try:
+                datastores_request = ListDatastoresRequest()
+                datastores_request.database_name = database_name
+                datastores_response = client.list_datastores(datastores_request)
+
+                # Validate if the target version is valid
+                valid_version = False
+                for datastore_info in datastores_response.data_stores:
+                    if datastore_info.name == target_version:
+                        upgrade_req.target_version = datastore_info.id
+                        self.log.info("Found target version %s, "
+                                      "ID: %s", target_version, datastore_info.id)
+                        valid_version = True
+                        break
+
+                if not valid_version:
+                    self.log.warning(
+                        "Target version %s not found, "
+                        "will use the default version for upgrade", target_version)
+            except Exception as e:
+                self.log.error("Failed to get the list of available versions: %s", e)
+
+        # Set backup if specified
+        if self.data.get('set_backup', False):
+            upgrade_req.with_backup = True
+        return upgrade_req
+
+    def perform_action(self, resource):
+        client = self.client
+        instance_id = resource['id']
+        name = resource['name']
 
         try:
             # Construct the version upgrade request
@@ -821,69 +980,30 @@ class UpgradeDBVersionAction(HuaweiCloudBaseAction):
             # POST /v3/{project_id}/instances/{instance_id}
             request = UpgradeDbVersionNewRequest()
             request.instance_id = instance_id
-
-            # Set upgrade parameters
-            upgrade_req = CustomerUpgradeDatabaseVersionReqNew()
-            upgrade_req.is_delayed = is_delayed
-
-            # If a target version is specified, set the target version
-            if target_version:
-                # First, get the list of available versions
-                try:
-                    datastore = resource.get('datastore', {})
-                    database_name = datastore.get('type', 'mysql').lower()
-
-                    # Get the list of available versions
-                    datastores_request = ListDatastoresRequest()
-                    datastores_request.database_name = database_name
-                    datastores_response = client.list_datastores(datastores_request)
-
-                    # Validate if the target version is valid
-                    valid_version = False
-                    for datastore_info in datastores_response.data_stores:
-                        if datastore_info.name == target_version:
-                            upgrade_req.target_version = datastore_info.id
-                            self.log.info(f"Found target version {target_version}, "
-                                          f"ID: {datastore_info.id}")
-                            valid_version = True
-                            break
-
-                    if not valid_version:
-                        self.log.warning(
-                            f"Target version {target_version} not found, "
-                            f"will use the default version for upgrade")
-                except Exception as e:
-                    self.log.error(f"Failed to get the list of available versions: {e}")
-
-            # Set backup if specified
-            if set_backup:
-                upgrade_req.with_backup = True
-
-            # Set the request body
-            request.body = upgrade_req
+            request.body = self.request_bodies[self._get_database_name(resource)]
 
             # Execute the upgrade request
             response = client.upgrade_db_version_new(request)
             self.log.info(
-                f"Successfully submitted database version upgrade request for RDS instance "
-                f"{resource['name']} (ID: {instance_id})")
+                "Successfully submitted database version upgrade request for RDS instance "
+                "%s (ID: %s)", name, instance_id)
 
             return response
         except exceptions.ClientRequestException as e:
             if e.error_code == "DBS.200971":
                 self.log.info(
-                    f"Already submitted database version upgrade delayed request for RDS instance "
-                    f"{resource['name']} (ID: {instance_id})")
+                    "Already submitted database version upgrade delayed request for RDS instance "
+                    "%s (ID: %s)", name, instance_id)
                 return
 
             self.log.error(
-                f"Failed to upgrade database version for RDS instance "
-                f"{resource['name']} (ID: {instance_id}): {e}")
+                "Failed to upgrade database version for RDS instance "
+                "%s (ID: %s): %s", name, instance_id, e)
             raise
 
 
 @RDS.action_registry.register('set-audit-log-policy')
-class SetAuditLogPolicyAction(HuaweiCloudBaseAction):
+class SetAuditLogPolicyAction(RDSBaseAction):
     """Set the audit log policy for the RDS instance
 
     :example:
@@ -917,16 +1037,34 @@ class SetAuditLogPolicyAction(HuaweiCloudBaseAction):
         audit_types={'type': 'array', 'items': {'type': 'string'}},
         log_group_name={'type': 'string'},
         log_topic_name={'type': 'string'},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
+    def process(self, resources):
+        # Every instance ships its audit log to the same LTS group and stream,
+        # so their ids are looked up once for the batch instead of per instance
+        self.lts_ids = None
+        log_group_name = self.data.get('log_group_name')
+        log_topic_name = self.data.get('log_topic_name')
+        if resources and log_group_name and log_topic_name:
+            resp_log_group_id, resp_log_stream_id = self.get_group_and_stream_id_by_name(
+                self.manager.session_factory, log_group_name, log_topic_name)
+            if not resp_log_group_id or not resp_log_stream_id:
+                raise PolicyExecutionError("Log group or log topic does not exist and "
+                                           "creation is set to 'no'. Cannot enable logging.")
+            self.log.info(
+                "[actions]- [SetAuditLogPolicyAction] log_group_id: %s,"
+                " log_stream_id: %s", resp_log_group_id, resp_log_stream_id)
+            self.lts_ids = (resp_log_group_id, resp_log_stream_id)
+        return super().process(resources)
+
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
         keep_days = self.data['keep_days']
         reserve_auditlogs = self.data.get('reserve_auditlogs', True)
         audit_types = self.data.get('audit_types', [])
-        log_group_name = self.data.get('log_group_name')
-        log_topic_name = self.data.get('log_topic_name')
 
         try:
             request = SetAuditlogPolicyRequest()
@@ -940,20 +1078,10 @@ class SetAuditLogPolicyAction(HuaweiCloudBaseAction):
             if audit_types and keep_days > 0:
                 request.body['audit_types'] = audit_types
 
-            if log_group_name and log_topic_name:
-                resp_log_group_id, resp_log_stream_id = SetAuditLogPolicyAction\
-                    .get_group_and_stream_id_by_name(self.manager.session_factory,
-                                                     log_group_name, log_topic_name
-                                                     )
-                if not resp_log_group_id or not resp_log_stream_id:
-                    raise Exception("Log group or log topic does not exist and "
-                                    "creation is set to 'no'. Cannot enable logging.")
-                self.log.info(
-                    f"[actions]- [SetAuditLogPolicyAction] log_group_id: {resp_log_group_id},"
-                    f" log_stream_id: {resp_log_stream_id}")
-
+            if self.lts_ids:
+                resp_log_group_id, resp_log_stream_id = self.lts_ids
                 request_lts = SetLogLtsConfigsRequest()
-                request_lts.engine = resource.get('datastore', {}).get('type', '').lower()
+                request_lts.engine = _get_engine(resource)
                 list_log_configsbody = [
                     AddLogConfigs(
                         instance_id=instance_id,
@@ -967,19 +1095,20 @@ class SetAuditLogPolicyAction(HuaweiCloudBaseAction):
                 )
                 client.set_log_lts_configs(request_lts)
                 self.log.info(
-                    f"Successfully connected to LTS for audit log"
-                    f"for RDS instance {resource['name']} (ID: {instance_id})")
+                    "Successfully connected to LTS for audit log"
+                    "for RDS instance %s (ID: %s)", name, instance_id)
                 time.sleep(10)
 
             response = client.set_auditlog_policy(request)
             self.log.info(
-                f"Successfully {'enabled' if keep_days > 0 else 'disabled'} audit log policy "
-                f"for RDS instance {resource['name']} (ID: {instance_id})")
+                "Successfully %s audit log policy "
+                "for RDS instance %s (ID: %s)",
+                'enabled' if keep_days > 0 else 'disabled', name, instance_id)
             return response
         except Exception as e:
             self.log.error(
-                f"Failed to set audit log policy for RDS instance "
-                f"{resource['name']} (ID: {instance_id}): {e}")
+                "Failed to set audit log policy for RDS instance "
+                "%s (ID: %s): %s", name, instance_id, e)
             raise
 
     @staticmethod
@@ -989,11 +1118,11 @@ class SetAuditLogPolicyAction(HuaweiCloudBaseAction):
         try:
             log_groups = lts_client_v2.list_log_groups(list_groups_request).log_groups
         except exceptions.ClientRequestException as e:
-            log.error(f'Get group_id by group_name failed, '
-                      f'request id:[{e.request_id}], '
-                      f'status code:[{e.status_code}], '
-                      f'error code:[{e.error_code}], '
-                      f'error message:[{e.error_msg}].')
+            log.error('Get group_id by group_name failed, '
+                      'request id:[%s], '
+                      'status code:[%s], '
+                      'error code:[%s], '
+                      'error message:[%s].', e.request_id, e.status_code, e.error_code, e.error_msg)
             raise PolicyExecutionError("Get group_id by group_name failed")
         group_id = ""
         for log_group in log_groups:
@@ -1011,11 +1140,11 @@ class SetAuditLogPolicyAction(HuaweiCloudBaseAction):
         try:
             log_streams = lts_client_v2.list_log_streams(list_streams_request).log_streams
         except exceptions.ClientRequestException as e:
-            log.error(f'Get stream_id by stream_name failed, '
-                      f'request id:[{e.request_id}], '
-                      f'status code:[{e.status_code}], '
-                      f'error code:[{e.error_code}], '
-                      f'error message:[{e.error_msg}].')
+            log.error('Get stream_id by stream_name failed, '
+                      'request id:[%s], '
+                      'status code:[%s], '
+                      'error code:[%s], '
+                      'error message:[%s].', e.request_id, e.status_code, e.error_code, e.error_msg)
             raise PolicyExecutionError("Get stream_id by stream_name failed")
         stream_id = ""
         for log_stream in log_streams:
@@ -1027,7 +1156,7 @@ class SetAuditLogPolicyAction(HuaweiCloudBaseAction):
 
 
 @RDS.action_registry.register('set-backup-policy')
-class SetBackupPolicyAction(HuaweiCloudBaseAction):
+class SetBackupPolicyAction(RDSBaseAction):
     """Set the auto backup policy for the RDS instance
 
     :example:
@@ -1052,16 +1181,25 @@ class SetBackupPolicyAction(HuaweiCloudBaseAction):
         keep_days={'type': 'integer', 'minimum': 1, 'maximum': 732},
         start_time={'type': 'string'},
         period={'type': 'string'},
-        reserve_backups={'enum': ['true', 'false'], 'default': 'true'}
+        reserve_backups={'enum': ['true', 'false'], 'default': 'true'},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
+    def process(self, resources):
+        # The backup policy is the same for every instance, build the body once
+        backupPolicyBody = BackupPolicy(keep_days=self.data['keep_days'],
+                                        start_time=self.data['start_time'],
+                                        period=self.data['period'])
+        self.request_body = SetBackupPolicyRequestBody(
+            backup_policy=backupPolicyBody,
+            reserve_backups=self.data.get('reserve_backups', 'true')
+        )
+        return super().process(resources)
+
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
-        keep_days = self.data['keep_days']
-        start_time = self.data['start_time']
-        period = self.data['period']
-        reserve_backups = self.data.get('reserve_backups', 'true')
+        name = resource['name']
 
         try:
             # Set backup policy
@@ -1069,31 +1207,21 @@ class SetBackupPolicyAction(HuaweiCloudBaseAction):
             # PUT /v3/{project_id}/instances/{instance_id}/backups/policy
             request = SetBackupPolicyRequest()
             request.instance_id = instance_id
-
-            backupPolicyBody = BackupPolicy(keep_days=keep_days,
-                                            start_time=start_time,
-                                            period=period)
-
-            # Construct the request body
-            request_body = SetBackupPolicyRequestBody(
-                backup_policy=backupPolicyBody,
-                reserve_backups=reserve_backups
-            )
-            request.body = request_body
+            request.body = self.request_body
 
             response = client.set_backup_policy(request)
-            self.log.info(f"Successfully set auto backup policy for RDS instance "
-                          f"{resource['name']} (ID: {instance_id})")
+            self.log.info("Successfully set auto backup policy for RDS instance "
+                          "%s (ID: %s)", name, instance_id)
             return response
         except exceptions.ClientRequestException as e:
             self.log.error(
-                f"Failed to set auto backup policy for RDS instance "
-                f"{resource['name']} (ID: {instance_id}): {e}")
+                "Failed to set auto backup policy for RDS instance "
+                "%s (ID: %s): %s", name, instance_id, e)
             raise
 
 
 @RDS.action_registry.register('update-instance-parameter')
-class UpdateInstanceParameterAction(HuaweiCloudBaseAction):
+class UpdateInstanceParameterAction(RDSBaseAction):
     """Modify the parameter configuration of an RDS instance
 
     :example:
@@ -1124,38 +1252,39 @@ class UpdateInstanceParameterAction(HuaweiCloudBaseAction):
                 'value': {'type': 'string'}
             },
             'required': ['name', 'value']
-        }}
+        }},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
+    def process(self, resources):
+        # The same parameters are pushed to every instance, so the request body
+        # is built once and only the instance id differs between requests.
+        self.request_body = UpdateInstanceConfigurationRequestBody(
+            values={param['name']: param['value'] for param in self.data['parameters']}
+        )
+        return super().process(resources)
+
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
-        parameters = self.data['parameters']
+        name = resource['name']
 
         try:
             # Modify instance parameters
             # API Document: https://support.huaweicloud.com/api-rds/rds_09_0303.html
             # PUT /v3/{project_id}/instances/{instance_id}/configurations
-            request = UpdateInstanceConfigurationRequest()
-            request.instance_id = instance_id
-
-            # Construct the request body
-            request_body = UpdateInstanceConfigurationRequestBody(
-                values={}
+            request = UpdateInstanceConfigurationRequest(
+                instance_id=instance_id,
+                body=self.request_body
             )
 
-            for param in parameters:
-                request_body.values[param['name']] = param['value']
-
-            request.body = request_body
-
             response = client.update_instance_configuration(request)
-            self.log.info(f"Successfully modified parameters for RDS instance "
-                          f"{resource['name']} (ID: {instance_id})")
+            self.log.info("Successfully modified parameters for RDS instance "
+                          "%s (ID: %s)", name, instance_id)
             return response
         except exceptions.ClientRequestException as e:
-            self.log.error(f"Failed to modify parameters for RDS instance "
-                           f"{resource['name']} (ID: {instance_id}): {e}")
+            self.log.error("Failed to modify parameters for RDS instance "
+                           "%s (ID: %s): %s", name, instance_id, e)
             raise
 
 
@@ -1195,13 +1324,15 @@ class PostgresqlHbaConfFilter(Filter):
     )
 
     def process(self, resources, event=None):
-        client = local_session(self.manager.session_factory).client("rds")
+        if not resources:
+            return resources
+        client = self.manager.get_client()
         has_config = self.data.get('has_config')
         matched_resources = []
 
         for resource in resources:
             # Process only PostgreSQL instances
-            if resource.get('datastore', {}).get('type', '').lower() != 'postgresql':
+            if _get_engine(resource) != 'postgresql':
                 continue
 
             instance_id = resource['id']
@@ -1253,13 +1384,13 @@ class PostgresqlHbaConfFilter(Filter):
                     matched_resources.append(resource)
             except Exception as e:
                 self.log.error(
-                    f"Failed to get the pg_hba.conf configuration for RDS PostgreSQL instance "
-                    f"{resource['name']} (ID: {instance_id}): {e}")
+                    "Failed to get the pg_hba.conf configuration for RDS PostgreSQL instance "
+                    "%s (ID: %s): %s", resource['name'], instance_id, e)
         return matched_resources
 
 
 @RDS.action_registry.register('modify-pg-hba-conf')
-class ModifyPgHbaConfAction(HuaweiCloudBaseAction):
+class ModifyPgHbaConfAction(RDSBaseAction):
     """Modify one or more configurations in the pg_hba.conf file
 
     :example:
@@ -1306,19 +1437,21 @@ class ModifyPgHbaConfAction(HuaweiCloudBaseAction):
                     'priority': {'type': 'integer'}
                 }
             }
-        }
+        },
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
         configs = self.data.get('configs', [])
 
         # Process only PostgreSQL instances
-        if resource.get('datastore', {}).get('type', '').lower() != 'postgresql':
-            self.log.warning(f"Instance {resource['name']}"
-                             f" (ID: {instance_id}) is not a PostgreSQL instance, "
-                             f"skipping modification of pg_hba.conf")
+        if _get_engine(resource) != 'postgresql':
+            self.log.warning("Instance %s"
+                             " (ID: %s) is not a PostgreSQL instance, "
+                             "skipping modification of pg_hba.conf", name, instance_id)
             return
 
         try:
@@ -1329,17 +1462,18 @@ class ModifyPgHbaConfAction(HuaweiCloudBaseAction):
             request.body = configs
 
             response = client.modify_postgresql_hba_conf(request)
-            self.log.info(f"Successfully modified RDS PostgreSQL instance {resource['name']}"
-                          f" (ID: {instance_id})'s pg_hba.conf configuration")
+            self.log.info("Successfully modified RDS PostgreSQL instance %s"
+                          " (ID: %s)'s pg_hba.conf configuration", name, instance_id)
             return response
         except Exception as e:
-            self.log.error(f"Failed to modify RDS PostgreSQL instance {resource['name']}"
-                           f" (ID: {instance_id})'s pg_hba.conf configuration: {e}")
+            self.log.error("Failed to modify RDS PostgreSQL instance %s"
+                           " (ID: %s)'s pg_hba.conf configuration: %s",
+                           name, instance_id, e)
             raise
 
 
 @RDS.action_registry.register('enable-tde')
-class EnableTDEAction(HuaweiCloudBaseAction):
+class EnableTDEAction(RDSBaseAction):
     """Enable TDE (Transparent Data Encryption) feature for SQL Server instances
 
     :example:
@@ -1361,18 +1495,20 @@ class EnableTDEAction(HuaweiCloudBaseAction):
         rotate_day={'type': 'integer', 'minimum': 1, 'maximum': 100000},
         secret_id={'type': 'string'},
         secret_name={'type': 'string'},
-        secret_version={'type': 'string'}
+        secret_version={'type': 'string'},
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
 
         # Check if it is a SQL Server instance
-        if resource.get('datastore', {}).get('type', '').lower() != 'sqlserver':
-            self.log.warning(f"Instance {resource['name']}"
-                             f" (ID: {instance_id}) is not a SQL Server instance, "
-                             f"skipping enabling TDE feature")
+        if _get_engine(resource) != 'sqlserver':
+            self.log.warning("Instance %s"
+                             " (ID: %s) is not a SQL Server instance, "
+                             "skipping enabling TDE feature", name, instance_id)
             return
 
         try:
@@ -1403,12 +1539,12 @@ class EnableTDEAction(HuaweiCloudBaseAction):
             request.body = body
 
             response = client.update_tde_status(request)
-            self.log.info(f"Successfully enabled TDE feature for RDS SQL Server "
-                          f"instance {resource['name']} (ID: {instance_id})")
+            self.log.info("Successfully enabled TDE feature for RDS SQL Server "
+                          "instance %s (ID: %s)", name, instance_id)
             return response
         except Exception as e:
-            self.log.error(f"Failed to enable TDE feature for RDS SQL Server "
-                           f"instance {resource['name']} (ID: {instance_id}): {e}")
+            self.log.error("Failed to enable TDE feature for RDS SQL Server "
+                           "instance %s (ID: %s): %s", name, instance_id, e)
             raise
 
 
@@ -1458,11 +1594,13 @@ class DbVersionFilter(Filter):
     )
 
     def process(self, resources, event=None):
-        client = local_session(self.manager.session_factory).client("rds")
+        if not resources:
+            return resources
+        client = self.manager.get_client()
         matched = []
         version_favored_dict = {}
         for resource in resources:
-            if resource.get('datastore', {}).get('type', '').lower() != 'postgresql':
+            if _get_engine(resource) != 'postgresql':
                 continue
 
             instance_id = resource['id']
@@ -1504,14 +1642,14 @@ class DbVersionFilter(Filter):
                             break
             except Exception as e:
                 self.log.error(
-                    f"[filters]- The filter:[dbVersionFilter] Failed for RDS instance "
-                    f"{resource['name']} (ID: {instance_id}): {e}")
+                    "[filters]- The filter:[dbVersionFilter] Failed for RDS instance "
+                    "%s (ID: %s): %s", resource['name'], instance_id, e)
                 raise
         return matched
 
 
 @RDS.action_registry.register('migrate-follower')
-class MigrateFollowerAction(HuaweiCloudBaseAction):
+class MigrateFollowerAction(RDSBaseAction):
     """Migrate the follower of the RDS instance
 
     :example:
@@ -1527,12 +1665,14 @@ class MigrateFollowerAction(HuaweiCloudBaseAction):
               - type: migrate-follower
     """
     schema = type_schema(
-        'migrate-follower'
+        'migrate-follower',
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
         nodes = resource.get('nodes')
         node_id = None
         master_az_code = None
@@ -1546,14 +1686,15 @@ class MigrateFollowerAction(HuaweiCloudBaseAction):
 
         if master_az_code != slave_az_code:
             self.log.info(
-                    f"[actions]- [MigrateFollowerAction]- The resource:[{resource['name']}"
-                    f" (ID: {instance_id})] does not need to be migrated to the standby node.")
+                    "[actions]- [MigrateFollowerAction]- The resource:[%s"
+                    " (ID: %s)] does not need to be migrated to the standby node.",
+                    name, instance_id)
             return
         try:
             # API: https://support.huaweicloud.com/api-rds/rds_06_0002.html
             # GET /v3/{project_id}/flavors/{database_name}
             request_flavor = ListFlavorsRequest()
-            request_flavor.database_name = resource.get('datastore', {}).get('type', '').lower()
+            request_flavor.database_name = _get_engine(resource)
             request_flavor.version_name = resource.get('datastore', {}).get('version', '')
             request_flavor.spec_code = resource.get('flavor_ref', '')
             response_flavor = client.list_flavors(request_flavor)
@@ -1564,11 +1705,12 @@ class MigrateFollowerAction(HuaweiCloudBaseAction):
                     new_slave_az_code = az
             if new_slave_az_code is None:
                 self.log.error(
-                    f"[actions]- [MigrateFollowerAction]- The resource:[{resource['name']} (ID: "
-                    f"{instance_id})] failed, casued: no available availability zone to migration.")
+                    "[actions]- [MigrateFollowerAction]- The resource:[%s (ID: "
+                    "%s)] failed, casued: no available availability zone to migration.",
+                    name, instance_id)
                 return
-            self.log.info(f"[actions]- [MigrateFollowerAction] new_slave_az_code :"
-                          f"{new_slave_az_code}")
+            self.log.info("[actions]- [MigrateFollowerAction] new_slave_az_code :"
+                          "%s", new_slave_az_code)
             # API Document: https://support.huaweicloud.com/api-rds/rds_05_0015.html
             # POST /v3/{project_id}/instances/{instance_id}/migrateslave
             request = MigrateFollowerRequest()
@@ -1580,13 +1722,13 @@ class MigrateFollowerAction(HuaweiCloudBaseAction):
             request.instance_id = instance_id
             request.body = request_body
             response = client.migrate_follower(request)
-            self.log.info(f"[actions]- [MigrateFollowerAction] Successfully migrate follower for"
-                          f" RDS instance {resource['name']} "
-                          f"(ID: {instance_id}) to {new_slave_az_code}")
+            self.log.info("[actions]- [MigrateFollowerAction] Successfully migrate follower for"
+                          " RDS instance %s "
+                          "(ID: %s) to %s", name, instance_id, new_slave_az_code)
             return response
         except exceptions.ClientRequestException as e:
-            self.log.error(f"[actions]- [MigrateFollowerAction] Failed to migrate follower for"
-                           f" RDS instance {resource['name']} (ID: {instance_id}): {e}")
+            self.log.error("[actions]- [MigrateFollowerAction] Failed to migrate follower for"
+                           " RDS instance %s (ID: %s): %s", name, instance_id, e)
             raise
 
 
@@ -1614,13 +1756,15 @@ class PostgresqlSslFilter(Filter):
     )
 
     def process(self, resources, event=None):
-        client = local_session(self.manager.session_factory).client("rds")
+        if not resources:
+            return resources
+        client = self.manager.get_client()
         hba_types = self.data.get('hba_types', [])
         matched_resources = []
 
         for resource in resources:
             # Process only PostgreSQL instances
-            if resource.get('datastore', {}).get('type', '').lower() != 'postgresql':
+            if _get_engine(resource) != 'postgresql':
                 continue
 
             instance_id = resource['id']
@@ -1649,15 +1793,15 @@ class PostgresqlSslFilter(Filter):
                     matched_resources.append(math_resource)
             except Exception as e:
                 self.log.error(
-                    f"[filter]- [PostgresqlSslFilter] Failed to get the pg_hba.conf"
-                    f" configuration for RDS PostgreSQL instance "
-                    f"{resource['name']} (ID: {instance_id}): {e}")
+                    "[filter]- [PostgresqlSslFilter] Failed to get the pg_hba.conf"
+                    " configuration for RDS PostgreSQL instance "
+                    "%s (ID: %s): %s", resource['name'], instance_id, e)
                 raise
         return matched_resources
 
 
 @RDS.action_registry.register('delete-pg-hba-conf')
-class DeletePgHbaConfAction(HuaweiCloudBaseAction):
+class DeletePgHbaConfAction(RDSBaseAction):
     """Delete one or more configurations in the pg_hba.conf file
 
     :example:
@@ -1689,21 +1833,23 @@ class DeletePgHbaConfAction(HuaweiCloudBaseAction):
                     'priority': {'type': 'integer'}
                 }
             }
-        }
+        },
+        max_workers={'type': 'integer', 'minimum': 1}
     )
 
     def perform_action(self, resource):
-        client = self.manager.get_client()
+        client = self.client
         instance_id = resource['id']
+        name = resource['name']
         configs = self.data.get('configs', [])
         if resource.get('filter_hba_config'):
             configs = resource.get('filter_hba_config')
 
         # Process only PostgreSQL instances
-        if resource.get('datastore', {}).get('type', '').lower() != 'postgresql' or not configs:
-            self.log.warning(f"[actions]- [DeletePgHbaConfAction] Instance {resource['name']}"
-                             f" (ID: {instance_id}) is not a PostgreSQL instance, "
-                             f"skipping delete of pg_hba.conf")
+        if _get_engine(resource) != 'postgresql' or not configs:
+            self.log.warning("[actions]- [DeletePgHbaConfAction] Instance %s"
+                             " (ID: %s) is not a PostgreSQL instance, "
+                             "skipping delete of pg_hba.conf", name, instance_id)
             return
 
         try:
@@ -1715,13 +1861,13 @@ class DeletePgHbaConfAction(HuaweiCloudBaseAction):
 
             response = client.delete_postgresql_hba_conf(request)
             self.log.info(
-                f"[actions]- [DeletePgHbaConfAction] Successfully delete RDS PostgreSQL"
-                f" instance {resource['name']}"
-                f" (ID: {instance_id})'s pg_hba.conf configuration")
+                "[actions]- [DeletePgHbaConfAction] Successfully delete RDS PostgreSQL"
+                " instance %s"
+                " (ID: %s)'s pg_hba.conf configuration", name, instance_id)
             return response
         except Exception as e:
             self.log.error(
-                f"[actions]- [DeletePgHbaConfAction] Failed to delete RDS PostgreSQL"
-                f" instance {resource['name']}"
-                f" (ID: {instance_id})'s pg_hba.conf configuration: {e}")
+                "[actions]- [DeletePgHbaConfAction] Failed to delete RDS PostgreSQL"
+                " instance %s"
+                " (ID: %s)'s pg_hba.conf configuration: %s", name, instance_id, e)
             raise
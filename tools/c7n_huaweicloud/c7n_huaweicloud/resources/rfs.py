@@ -2,20 +2,25 @@
 # SPDX-License-Identifier: Apache-2.0
 import logging
 import uuid
+from functools import partial
 
+from huaweicloudsdkcore.exceptions import exceptions
+from retrying import retry
 from huaweicloudsdkaos.v1 import (UpdateStackRequestBody, UpdateStackRequest,
                                   GetStackMetadataRequest)
 
 from c7n.utils import type_schema
-from c7n_huaweicloud.actions.base import HuaweiCloudBaseAction
+from c7n_huaweicloud.actions.base import HuaweiCloudBaseAction, is_idempotent_retryable_exception
 from c7n_huaweicloud.provider import resources
-from c7n_huaweicloud.query import QueryResourceManager, TypeInfo
+from c7n_huaweicloud.query import QueryResourceManager, SharedClientMixin, TypeInfo
 
 log = logging.getLogger("custodian.huaweicloud.resources.rfs")
 
+MAX_WORKERS = 5
+
 
 @resources.register('rfs-stack')
-class Stack(QueryResourceManager):
+class Stack(SharedClientMixin, QueryResourceManager):
     class resource_type(TypeInfo):
         service = 'rfs'
         resource_type_name = 'rfs-stack'
@@ -25,25 +30,38 @@ class Stack(QueryResourceManager):
 
     def augment(self, resources):
         client = self.get_client()
-        result = []
-        for resource in resources:
-            try:
-                request = GetStackMetadataRequest(
-                    client_request_id=str(uuid.uuid1()),
-                    stack_name=resource['stack_name'],
-                    stack_id=resource['id']
-                )
-                response = client.get_stack_metadata(request)
-                resource = response.to_dict()
-                resource['id'] = resource['stack_id']
-                result.append(resource)
-            except Exception as e:
-                log.error(f"Failed to fetch full metadata for stack {resource['id']}: {e}")
-                raise e
-            # enable sleep here to prevent API rate limiting from cascading queries
-            # when timer policy is supported later
-            # time.sleep(random.uniform(0.1, 0.2))
-        return result
+        # get_stack_metadata is one round trip per stack, fetch them
+        # concurrently and keep the listing order
+        with self.executor_factory(max_workers=MAX_WORKERS) as w:
+            stacks = w.map(partial(self.get_stack_metadata, client), resources)
+            return [stack for stack in stacks if stack is not None]
+
+    @retry(retry_on_exception=is_idempotent_retryable_exception,
+           wait_exponential_multiplier=1000,
+           wait_exponential_max=10000,
+           wait_jitter_max=1000,
+           stop_max_attempt_number=5)
+    def get_stack_metadata(self, client, resource):
+        request = GetStackMetadataRequest(
+            client_request_id=str(uuid.uuid4()),
+            stack_name=resource['stack_name'],
+            stack_id=resource['id']
+        )
+        try:
+            response = client.get_stack_metadata(request)
+        except exceptions.ServiceResponseException as e:
+            if e.status_code == 404:
+                # the stack was deleted after it was listed
+                log.warning("Stack %s no longer exists, skip it", resource['id'])
+                return None
+            if not is_idempotent_retryable_exception(e):
+                # retried errors would be logged once per attempt, they are
+                # left to the caller once the retries are exhausted
+                log.error("Failed to fetch full metadata for stack %s: %s", resource['id'], e)
+            raise
+        resource = response.to_dict()
+        resource['id'] = resource['stack_id']
+        return resource
 
     def get_resources(self, resource_ids):
         resources = (
@@ -80,18 +98,18 @@ class EnableDeletionProtection(HuaweiCloudBaseAction):
     def perform_action(self, resource):
         client = self.manager.get_client()
         try:
-            log.info(f"Start enable deletion protection for stack {resource['stack_id']}")
+            log.info("Start enable deletion protection for stack %s", resource['stack_id'])
             request_body = UpdateStackRequestBody(
                 enable_deletion_protection=True,
                 stack_id=resource['stack_id']
             )
             request = UpdateStackRequest(
-                client_request_id=str(uuid.uuid1()),
+                client_request_id=str(uuid.uuid4()),
                 stack_name=resource['stack_name'],
                 body=request_body
             )
             client.update_stack(request)
-            log.info(f"Successfully enable deletion protection for stack {resource['stack_id']}")
+            log.info("Successfully enable deletion protection for stack %s", resource['stack_id'])
         except Exception as e:
-            log.error(f"Failed to enable deletion protection for stack {resource['stack_id']}")
+            log.error("Failed to enable deletion protection for stack %s", resource['stack_id'])
             raise e
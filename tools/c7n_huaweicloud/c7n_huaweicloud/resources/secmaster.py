@@ -2,13 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from functools import partial
+
+from dateutil.parser import parse
 
 from c7n.utils import local_session, type_schema
-from c7n.filters import AgeFilter
 from c7n_huaweicloud.actions.base import HuaweiCloudBaseAction
+from c7n_huaweicloud.filters.time import IsoDateAgeFilter
 from c7n_huaweicloud.provider import resources
-from c7n_huaweicloud.query import QueryResourceManager, TypeInfo
+from c7n_huaweicloud.query import QueryResourceManager, SharedClientMixin, TypeInfo
 from c7n.filters.missing import Missing
+from huaweicloudsdkcore.exceptions import exceptions
 from huaweicloudsdksecmaster.v2 import (
     ListAlertsRequest,
     ListPlaybooksRequest,
@@ -24,6 +28,9 @@ from huaweicloudsdksmn.v2 import (
 
 log = logging.getLogger("custodian.huaweicloud.resources.secmaster")
 
+# workspaces whose alerts and playbooks are listed in parallel
+MAX_WORKERS = 5
+
 
 @resources.register("secmaster")
 class SecMaster(QueryResourceManager):
@@ -89,9 +96,9 @@ class SecMasterSendMsg(HuaweiCloudBaseAction):
         subject = self.data.get("subject", "SecMaster notification")
 
         log.info(
-            f"TODO: Send SecMaster notification - Subject: {subject}, Message: {message}"
+            "TODO: Send SecMaster notification - Subject: %s, Message: %s", subject, message
         )
-        log.info(f"Resource ID: {resource.get('id', 'unknown')}")
+        log.info("Resource ID: %s", resource.get('id', 'unknown'))
 
         # TODO: Implement the email notification logic
         return {
@@ -190,19 +197,20 @@ class WorkspaceSendMsg(HuaweiCloudBaseAction):
             subject = "SecMaster Automatic notification"
             message = "The workspace does not exist"
             body = PublishMessageRequestBody(subject=subject, message=message)
+            # one SMN client, and connection, for all topics
+            client = local_session(self.manager.session_factory).client("smn")
             for topic_urn in topic_urn_list:
                 publish_message_request = PublishMessageRequest(
                     topic_urn=topic_urn, body=body
                 )
-                log.info(f"Message send, request: {publish_message_request}")
+                log.info("Message send, request: %s", publish_message_request)
                 try:
-                    client = local_session(self.manager.session_factory).client("smn")
                     publish_message_response = client.publish_message(
                         publish_message_request
                     )
-                    log.info(f"Message send, response: {publish_message_response}")
+                    log.info("Message send, response: %s", publish_message_response)
                 except Exception as e:
-                    log.error(f"Message send, failed: {e}")
+                    log.error("Message send, failed: %s", e)
 
         return resources
 
@@ -211,7 +219,7 @@ class WorkspaceSendMsg(HuaweiCloudBaseAction):
 
 
 @resources.register("secmaster-alert")
-class SecMasterAlert(QueryResourceManager):
+class SecMasterAlert(SharedClientMixin, QueryResourceManager):
     """Huawei Cloud SecMaster alert resource manager.
 
     Used to manage SecMaster alerts to ensure log recording and alerts are set.
@@ -243,87 +251,91 @@ class SecMasterAlert(QueryResourceManager):
         workspace_manager = self.get_resource_manager("huaweicloud.secmaster-workspace")
         workspaces = workspace_manager.resources()
 
-        for workspace in workspaces:
-            workspace_id = workspace.get("id")
-            is_view = workspace.get("is_view", False)
-            if not workspace_id or is_view:
-                continue
+        with self.executor_factory(max_workers=MAX_WORKERS) as w:
+            for alerts in w.map(partial(self._fetch_workspace_alerts, client), workspaces):
+                resources.extend(alerts)
+        return self.augment(resources) or []
+        # return resources
 
-            offset = 0
-            limit = 500
+    def _fetch_workspace_alerts(self, client, workspace):
+        """Get the alerts of a single workspace, following every page."""
+        alerts = []
+        workspace_id = workspace.get("id")
+        is_view = workspace.get("is_view", False)
+        if not workspace_id or is_view:
+            return alerts
 
-            while True:
-                try:
-                    # Create a search request body
-                    search_body = DataobjectSearch(limit=limit, offset=offset)
+        offset = 0
+        limit = 500
 
-                    request = ListAlertsRequest(
-                        workspace_id=workspace_id, body=search_body
-                    )
-                    response = client.list_alerts(request)
+        # Build the request once per workspace, only the offset changes per page
+        search_body = DataobjectSearch(limit=limit, offset=offset)
+        request = ListAlertsRequest(workspace_id=workspace_id, body=search_body)
 
-                    if not response.data:
-                        break
+        while True:
+            try:
+                search_body.offset = offset
+                response = client.list_alerts(request)
 
-                    # Convert the response data to dictionary format
-                    for alert in response.data:
-                        if hasattr(alert, "to_dict"):
-                            alert_dict = alert.to_dict()
-                        else:
-                            alert_dict = alert
+                if not response.data:
+                    break
 
-                        # Keep the original hierarchical structure, do not flatten data_object
-                        # Add workspace information to the top level
-                        alert_dict["workspace_name"] = workspace.get("name")
-                        alert_dict["workspace_id"] = workspace.get("id")
-                        resources.append(alert_dict)
+                # Convert the response data to dictionary format
+                for alert in response.data:
+                    if hasattr(alert, "to_dict"):
+                        alert_dict = alert.to_dict()
+                    else:
+                        alert_dict = alert
 
-                    # Check if there is more data
-                    if len(response.data) < limit:
-                        break
+                    # Keep the original hierarchical structure, do not flatten data_object
+                    # Add workspace information to the top level
+                    alert_dict["workspace_name"] = workspace.get("name")
+                    alert_dict["workspace_id"] = workspace.get("id")
+                    alerts.append(alert_dict)
 
-                    offset += limit
+                # Check if there is more data, total spares the request for an
+                # empty page when the count is a multiple of limit
+                offset += limit
+                if len(response.data) < limit or (
+                    response.total is not None and offset >= response.total
+                ):
+                    break
 
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    # Distinguish different types of errors
-                    if any(
-                        x in error_msg
-                        for x in ["unauthorized", "401", "authentication", "credential"]
-                    ):
-                        log.error(
-                            f"alert query authentication failed (Workspace: {workspace_id}): {e}"
-                        )
-                        raise  # Re-throw authentication error
-                    elif any(
-                        x in error_msg
-                        for x in ["not found", "404", "resource not exist"]
-                    ):
-                        log.info(
-                            f"Workspace {workspace_id} has no alert resources, skipping: {e}"
-                        )
-                        break  # No alerts is a normal situation
-                    elif any(
-                        x in error_msg for x in ["forbidden", "403", "permission"]
-                    ):
-                        log.error(
-                            f"alert query permission insufficient (Workspace: {workspace_id}): {e}"
-                        )
-                        raise  # Re-throw permission error
-                    else:
-                        log.error(
-                            f"Failed to get the alert list for workspace {workspace_id}: {e}"
-                        )
-                        raise  # Re-throw other unknown errors
-        return self.augment(resources) or []
-        # return resources
+            except Exception as e:
+                status_code = (
+                    e.status_code
+                    if isinstance(e, exceptions.ClientRequestException)
+                    else None
+                )
+                # Distinguish different types of errors
+                if status_code == 401:
+                    log.error(
+                        "alert query authentication failed (Workspace: %s): %s", workspace_id, e
+                    )
+                    raise  # Re-throw authentication error
+                elif status_code == 404:
+                    log.info(
+                        "Workspace %s has no alert resources, skipping: %s", workspace_id, e
+                    )
+                    break  # No alerts is a normal situation
+                elif status_code == 403:
+                    log.error(
+                        "alert query permission insufficient (Workspace: %s): %s", workspace_id, e
+                    )
+                    raise  # Re-throw permission error
+                else:
+                    log.error(
+                        "Failed to get the alert list for workspace %s: %s", workspace_id, e
+                    )
+                    raise  # Re-throw other unknown errors
+        return alerts
 
 
 SecMasterAlert.filter_registry.register("missing", Missing)
 
 
 @SecMasterAlert.filter_registry.register("age")
-class AlertAgeFilter(AgeFilter):
+class AlertAgeFilter(IsoDateAgeFilter):
     """SecMaster alert age filter.
 
     Filter alerts created within N days/hours/minutes based on the alert creation time.
@@ -388,19 +400,20 @@ class AlertSendMsg(HuaweiCloudBaseAction):
             subject = "SecMaster Automatic notification"
             message = "have alert was generated within one day"
             body = PublishMessageRequestBody(subject=subject, message=message)
+            # one SMN client, and connection, for all topics
+            client = local_session(self.manager.session_factory).client("smn")
             for topic_urn in topic_urn_list:
                 publish_message_request = PublishMessageRequest(
                     topic_urn=topic_urn, body=body
                 )
-                log.info(f"Message send, request: {publish_message_request}")
+                log.info("Message send, request: %s", publish_message_request)
                 try:
-                    client = local_session(self.manager.session_factory).client("smn")
                     publish_message_response = client.publish_message(
                         publish_message_request
                     )
-                    log.info(f"Message send, response: {publish_message_response}")
+                    log.info("Message send, response: %s", publish_message_response)
                 except Exception as e:
-                    log.error(f"Message send, failed: {e}")
+                    log.error("Message send, failed: %s", e)
 
         return resources
 
@@ -444,19 +457,20 @@ class AlertSendMsgWhenResourceNone(HuaweiCloudBaseAction):
             subject = "SecMaster Automatic notification"
             message = "No alert was generated within one day"
             body = PublishMessageRequestBody(subject=subject, message=message)
+            # one SMN client, and connection, for all topics
+            client = local_session(self.manager.session_factory).client("smn")
             for topic_urn in topic_urn_list:
                 publish_message_request = PublishMessageRequest(
                     topic_urn=topic_urn, body=body
                 )
-                log.info(f"Message send, request: {publish_message_request}")
+                log.info("Message send, request: %s", publish_message_request)
                 try:
-                    client = local_session(self.manager.session_factory).client("smn")
                     publish_message_response = client.publish_message(
                         publish_message_request
                     )
-                    log.info(f"Message send, response: {publish_message_response}")
+                    log.info("Message send, response: %s", publish_message_response)
                 except Exception as e:
-                    log.error(f"Message send, failed: {e}")
+                    log.error("Message send, failed: %s", e)
 
         return resources
 
@@ -465,7 +479,7 @@ class AlertSendMsgWhenResourceNone(HuaweiCloudBaseAction):
 
 
 @resources.register("secmaster-playbook")
-class SecMasterPlaybook(QueryResourceManager):
+class SecMasterPlaybook(SharedClientMixin, QueryResourceManager):
     """Huawei Cloud SecMaster playbook resource manager.
 
     Used to manage SecMaster playbooks to ensure  high-risk operations are reported to SecMaster.
@@ -499,75 +513,83 @@ class SecMasterPlaybook(QueryResourceManager):
         # Get the list of workspaces to query playbooks for each workspace
         workspace_manager = self.get_resource_manager("huaweicloud.secmaster-workspace")
         workspaces = workspace_manager.resources()
-        for workspace in workspaces:
-            workspace_id = workspace.get("id")
-            is_view = workspace.get("is_view", False)
-            if not workspace_id or is_view:
-                continue
+        with self.executor_factory(max_workers=MAX_WORKERS) as w:
+            for playbooks in w.map(partial(self._fetch_workspace_playbooks, client), workspaces):
+                resources.extend(playbooks)
 
-            offset = 0
-            limit = 500
+        return resources
 
-            while True:
-                try:
-                    request = ListPlaybooksRequest(
-                        workspace_id=workspace_id, offset=offset, limit=limit
-                    )
-                    response = client.list_playbooks(request)
+    def _fetch_workspace_playbooks(self, client, workspace):
+        """Get the playbooks of a single workspace, following every page."""
+        playbooks = []
+        workspace_id = workspace.get("id")
+        is_view = workspace.get("is_view", False)
+        if not workspace_id or is_view:
+            return playbooks
 
-                    if not response.data:
-                        break
+        offset = 0
+        limit = 500
 
-                    # Convert the response data to dictionary format
-                    for playbook in response.data:
-                        if hasattr(playbook, "to_dict"):
-                            playbook_dict = playbook.to_dict()
-                        else:
-                            playbook_dict = playbook
-                        # Add workspace information
-                        playbook_dict["workspace_id"] = workspace_id
-                        playbook_dict["workspace_name"] = workspace.get("name")
-                        resources.append(playbook_dict)
+        # Build the request once per workspace, only the offset changes per page
+        request = ListPlaybooksRequest(
+            workspace_id=workspace_id, offset=offset, limit=limit
+        )
 
-                    # Check if there is more data
-                    if len(response.data) < limit:
-                        break
+        while True:
+            try:
+                request.offset = offset
+                response = client.list_playbooks(request)
 
-                    offset += limit
+                if not response.data:
+                    break
 
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    # Distinguish different types of errors
-                    if any(
-                        x in error_msg
-                        for x in ["unauthorized", "401", "authentication", "credential"]
-                    ):
-                        log.error(
-                            f"playbook query authentication failed (Workspace: {workspace_id}): {e}"
-                        )
-                        raise  # Re-throw authentication error
-                    elif any(
-                        x in error_msg
-                        for x in ["not found", "404", "resource not exist"]
-                    ):
-                        log.info(
-                            f"Workspace {workspace_id} has no playbook resources, skipping: {e}"
-                        )
-                        break  # No playbooks is a normal situation
-                    elif any(
-                        x in error_msg for x in ["forbidden", "403", "permission"]
-                    ):
-                        log.error(
-                            f"playbook query permission (Workspace: {workspace_id}): {e}"
-                        )
-                        raise  # Re-throw permission error
+                # Convert the response data to dictionary format
+                for playbook in response.data:
+                    if hasattr(playbook, "to_dict"):
+                        playbook_dict = playbook.to_dict()
                     else:
-                        log.error(
-                            f"Failed to get the playbook list for workspace {workspace_id}: {e}"
-                        )
-                        raise  # Re-throw other unknown errors
+                        playbook_dict = playbook
+                    # Add workspace information
+                    playbook_dict["workspace_id"] = workspace_id
+                    playbook_dict["workspace_name"] = workspace.get("name")
+                    playbooks.append(playbook_dict)
+
+                # Check if there is more data, total spares the request for an
+                # empty page when the count is a multiple of limit
+                offset += limit
+                if len(response.data) < limit or (
+                    response.total is not None and offset >= response.total
+                ):
+                    break
 
-        return resources
+            except Exception as e:
+                status_code = (
+                    e.status_code
+                    if isinstance(e, exceptions.ClientRequestException)
+                    else None
+                )
+                # Distinguish different types of errors
+                if status_code == 401:
+                    log.error(
+                        "playbook query authentication failed (Workspace: %s): %s", workspace_id, e
+                    )
+                    raise  # Re-throw authentication error
+                elif status_code == 404:
+                    log.info(
+                        "Workspace %s has no playbook resources, skipping: %s", workspace_id, e
+                    )
+                    break  # No playbooks is a normal situation
+                elif status_code == 403:
+                    log.error(
+                        "playbook query permission (Workspace: %s): %s", workspace_id, e
+                    )
+                    raise  # Re-throw permission error
+                else:
+                    log.error(
+                        "Failed to get the playbook list for workspace %s: %s", workspace_id, e
+                    )
+                    raise  # Re-throw other unknown errors
+        return playbooks
 
 
 @SecMasterPlaybook.action_registry.register("enable-playbook")
@@ -605,7 +627,7 @@ class EnablePlaybook(HuaweiCloudBaseAction):
 
         if not workspace_id or not playbook_id:
             log.error(
-                f"ID is missing: workspace_id={workspace_id}, playbook_id={playbook_id}"
+                "ID is missing: workspace_id=%s, playbook_id=%s", workspace_id, playbook_id
             )
             return {
                 "status": "error",
@@ -614,7 +636,7 @@ class EnablePlaybook(HuaweiCloudBaseAction):
 
         try:
             # First, query the playbook version list to find the latest version
-            log.info(f"Querying the version list of playbook {playbook_name}...")
+            log.info("Querying the version list of playbook %s...", playbook_name)
 
             offset = 0
             limit = 500
@@ -645,8 +667,6 @@ class EnablePlaybook(HuaweiCloudBaseAction):
                     if update_time_str:
                         try:
                             # Parse the time string
-                            from dateutil.parser import parse
-
                             update_time = parse(update_time_str)
 
                             if (
@@ -657,23 +677,27 @@ class EnablePlaybook(HuaweiCloudBaseAction):
                                 latest_version = version_dict
                         except Exception as e:
                             log.warning(
-                                f"Failed to parse time: {update_time_str}, Error: {e}"
+                                "Failed to parse time: %s, Error: %s", update_time_str, e
                             )
                             continue
 
-                # Check if there is more data
-                if len(version_response.data) < limit:
-                    break
-
+                # Check if there is more data, total spares the request for an
+                # empty page when the count is a multiple of limit
                 offset += limit
+                if len(version_response.data) < limit or (
+                    version_response.total is not None and offset >= version_response.total
+                ):
+                    break
 
             if not latest_version:
-                log.error(f"No versions found for playbook {playbook_name}")
+                log.error("No versions found for playbook %s", playbook_name)
                 return {"status": "error", "message": "No playbook versions found"}
 
             active_version_id = latest_version.get("id")
             log.info(
-                f"Latest version found: {latest_version.get('version')} (ID: {active_version_id})"
+                "Latest version found: %s (ID: %s)",
+                latest_version.get('version'),
+                active_version_id,
             )
 
             # Build the modified playbook information to enable the playbook
@@ -693,7 +717,7 @@ class EnablePlaybook(HuaweiCloudBaseAction):
             client.update_playbook(request)
 
             log.info(
-                f"enabled playbook: {playbook_name},{latest_version.get('version')}"
+                "enabled playbook: %s,%s", playbook_name, latest_version.get('version')
             )
             return {
                 "status": "success",
@@ -704,7 +728,7 @@ class EnablePlaybook(HuaweiCloudBaseAction):
             }
 
         except Exception as e:
-            log.error(f"Failed to enable playbook: {e}")
+            log.error("Failed to enable playbook: %s", e)
             return {"status": "error", "message": str(e)}
 
 
@@ -744,14 +768,14 @@ class PlaybookSendMsg(HuaweiCloudBaseAction):
         subject = self.data.get("subject", "SecMaster playbook notification")
 
         log.info(
-            f"TODO: Send playbook notification - Subject: {subject}, Message: {message}"
+            "TODO: Send playbook notification - Subject: %s, Message: %s", subject, message
         )
         log.info(
-            f"Playbook: {resource.get('name', 'unknown')} (ID: {resource.get('id', 'unknown')})"
+            "Playbook: %s (ID: %s)", resource.get('name', 'unknown'), resource.get('id', 'unknown')
         )
-        log.info(f"Workspace: {resource.get('workspace_name', 'unknown')}")
+        log.info("Workspace: %s", resource.get('workspace_name', 'unknown'))
         log.info(
-            f"Playbook status: {'Enabled' if resource.get('enabled') else 'Disabled'}"
+            "Playbook status: %s", 'Enabled' if resource.get('enabled') else 'Disabled'
         )
 
         # TODO: Implement the email notification logic
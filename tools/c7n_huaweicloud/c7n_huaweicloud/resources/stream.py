@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import threading
 import time
+from functools import partial
 
 from huaweicloudsdklts.v2 import UpdateLogStreamRequest, UpdateLogStreamParams, \
     ListLogGroupsRequest, ListLogStreamRequest
@@ -11,14 +13,52 @@ from c7n.utils import type_schema
 from c7n_huaweicloud.actions.base import HuaweiCloudBaseAction
 from c7n.filters import Filter
 from c7n_huaweicloud.provider import resources
-from c7n_huaweicloud.query import QueryResourceManager, TypeInfo
+from c7n_huaweicloud.query import QueryResourceManager, SharedClientMixin, TypeInfo
 
 
 log = logging.getLogger("custodian.huaweicloud.resources.lts-stream")
 
+MAX_WORKERS = 5
+
+
+class RateLimiter:
+    """Token bucket pacing the LTS calls of this module.
+
+    Callers only block in acquire() once they run ahead of ``rate`` calls per
+    second, so an idle API is not slowed down and concurrent workers share
+    one budget.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # take the token now, callers behind us wait for the refill
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return
+            wait = -self.tokens / self.rate
+        time.sleep(wait)
+
+
+# LTS calls per second, the budget of the former time.sleep(0.5) pacing
+LTS_CALLS_PER_SECOND = 2
+# no burst above that budget
+LTS_CALLS_BURST = 1
+
+LTS_LIMITER = RateLimiter(rate=LTS_CALLS_PER_SECOND, burst=LTS_CALLS_BURST)
+
 
 @resources.register('lts-stream')
-class Stream(QueryResourceManager):
+class Stream(SharedClientMixin, QueryResourceManager):
     class resource_type(TypeInfo):
         service = 'lts-stream'
         enum_spec = ("list_log_groups", 'log_groups', 'offset')
@@ -28,40 +68,44 @@ class Stream(QueryResourceManager):
 
     def get_resources(self, resource_ids):
         client = self.get_client()
+        log.debug("[event/period]-The resource_ids are [%s]", resource_ids)
+        pending = set(resource_ids)
         streams = []
-        request = ListLogGroupsRequest()
-        stream_request = ListLogStreamRequest()
-        response = client.list_log_groups(request)
-        log.debug("[event/period]-The resource_ids are [{}]".format(resource_ids))
-        should_break = False
+        response = client.list_log_groups(ListLogGroupsRequest())
         for group in response.log_groups:
-            time.sleep(0.5)
-            stream_request.log_group_id = group.log_group_id
-            try:
-                stream_response = client.list_log_stream(stream_request)
-                for stream in stream_response.log_streams:
-                    if stream.log_stream_id == resource_ids[0] and stream.whether_log_storage:
-                        streamDict = {}
-                        streamDict["log_group_name"] = group.log_group_name
-                        streamDict["log_group_id"] = group.log_group_id
-                        streamDict["log_stream_id"] = stream.log_stream_id
-                        streamDict["log_stream_name"] = stream.log_stream_name
-                        streamDict["id"] = stream.log_stream_id
-                        streamDict["tags"] = stream.tag
-                        streamDict["id"] = stream.log_stream_id
-                        streamDict["tag_resource_type"] = "topics"
-                        streams.append(streamDict)
-                        should_break = True
-                        break
-            except Exception as e:
-                log.error("[filters]-The filter:[streams-storage-enabled] query the service:[LTS:"
-                          "list_log_stream] failed. cause: {}".format(e))
-                raise
-            if should_break:
+            # stop scanning the groups as soon as every requested stream is found
+            if not pending:
                 break
-        log.info("[event/period]-The filtered resources has [{}]"
-                 " in total. ".format(str(len(streams))))
-        log.debug("[event/period]-The filtered resources are [{}]".format(streams))
+            for stream in self.get_group_streams(client, group):
+                if stream["id"] in pending:
+                    pending.discard(stream["id"])
+                    streams.append(stream)
+        log.info("[event/period]-The filtered resources has [%s]"
+                 " in total. ", len(streams))
+        log.debug("[event/period]-The filtered resources are [%s]", streams)
+        return streams
+
+    def get_group_streams(self, client, group):
+        stream_request = ListLogStreamRequest(log_group_id=group.log_group_id)
+        streams = []
+        try:
+            LTS_LIMITER.acquire()
+            stream_response = client.list_log_stream(stream_request)
+            for stream in stream_response.log_streams:
+                if stream.whether_log_storage:
+                    streamDict = {}
+                    streamDict["log_group_name"] = group.log_group_name
+                    streamDict["log_group_id"] = group.log_group_id
+                    streamDict["log_stream_id"] = stream.log_stream_id
+                    streamDict["log_stream_name"] = stream.log_stream_name
+                    streamDict["id"] = stream.log_stream_id
+                    streamDict["tags"] = stream.tag
+                    streamDict["tag_resource_type"] = "topics"
+                    streams.append(streamDict)
+        except Exception as e:
+            log.error("[filters]-The filter:[streams-storage-enabled] query the service:[LTS:"
+                      "list_log_stream] failed. cause: %s", e)
+            raise
         return streams
 
 
@@ -83,31 +127,38 @@ class LtsStreamStorageEnabledFilterForSchedule(Filter):
 
     def process(self, resources, event=None):
         client = self.manager.get_client()
+        streams = []
+        with self.executor_factory(max_workers=MAX_WORKERS) as w:
+            for group_streams in w.map(partial(self.get_storage_enabled_streams, client),
+                                       resources):
+                streams.extend(group_streams)
+        log.info("[event/period]-The filtered resources has [%s]"
+                 " in total. ", len(streams))
+        log.debug("[event/period]-The filtered resources is [%s]", streams)
+        return streams
+
+    def get_storage_enabled_streams(self, client, group):
         request = ListLogStreamRequest()
+        request.log_group_id = group["log_group_id"]
         streams = []
-        for group in resources:
-            request.log_group_id = group["log_group_id"]
-            try:
-                time.sleep(0.5)
-                response = client.list_log_stream(request)
-                for stream in response.log_streams:
-                    if stream.whether_log_storage:
-                        streamDict = {}
-                        streamDict["log_group_name"] = group["log_group_name"]
-                        streamDict["log_group_id"] = group["log_group_id"]
-                        streamDict["log_stream_id"] = stream.log_stream_id
-                        streamDict["log_stream_name"] = stream.log_stream_name
-                        streamDict["id"] = stream.log_stream_id
-                        streamDict["tag_resource_type"] = "topics"
-                        streamDict["tags"] = stream.tag
-                        streams.append(streamDict)
-            except Exception as e:
-                log.error("[filters]-The filter:[streams-storage-enabled-for-schedule] query the"
-                             " service:[LTS:lts_log_stream] failed. cause: {}".format(e))
-                raise
-        log.info("[event/period]-The filtered resources has [{}]"
-                    " in total. ".format(str(len(streams))))
-        log.debug("[event/period]-The filtered resources is [{}]".format(streams))
+        try:
+            LTS_LIMITER.acquire()
+            response = client.list_log_stream(request)
+            for stream in response.log_streams:
+                if stream.whether_log_storage:
+                    streamDict = {}
+                    streamDict["log_group_name"] = group["log_group_name"]
+                    streamDict["log_group_id"] = group["log_group_id"]
+                    streamDict["log_stream_id"] = stream.log_stream_id
+                    streamDict["log_stream_name"] = stream.log_stream_name
+                    streamDict["id"] = stream.log_stream_id
+                    streamDict["tag_resource_type"] = "topics"
+                    streamDict["tags"] = stream.tag
+                    streams.append(streamDict)
+        except Exception as e:
+            log.error("[filters]-The filter:[streams-storage-enabled-for-schedule] query the"
+                      " service:[LTS:lts_log_stream] failed. cause: %s", e)
+            raise
         return streams
 
 
@@ -115,21 +166,28 @@ class LtsStreamStorageEnabledFilterForSchedule(Filter):
 class LtsDisableStreamStorage(HuaweiCloudBaseAction):
     schema = type_schema("disable-stream-storage")
 
+    # the update body is the same for every stream, build it once
+    disable_storage_body = UpdateLogStreamParams(whether_log_storage=False)
+
+    def process(self, resources):
+        # LTS_LIMITER paces the updates, the workers only overlap the round trips
+        with self.executor_factory(max_workers=MAX_WORKERS) as w:
+            list(w.map(self.process_action, resources))
+        return self.process_result(resources)
+
     def perform_action(self, resource):
-        time.sleep(0.5)
+        LTS_LIMITER.acquire()
         try:
             client = self.manager.get_client()
             request = UpdateLogStreamRequest()
             request.log_group_id = resource["log_group_id"]
             request.log_stream_id = resource["log_stream_id"]
-            request.body = UpdateLogStreamParams(
-                whether_log_storage=False
-            )
+            request.body = self.disable_storage_body
             log.info("[actions]-[disable-stream-storage]: The resource:[stream] with"
-                     "id:[{}] modify storage successed".format(resource["log_stream_id"]))
+                     "id:[%s] modify storage successed", resource["log_stream_id"])
             response = client.update_log_stream(request)
             return response
         except Exception as e:
             log.error("[actions]-[disable-stream-storage]-The resource:[stream] with id:"
-                      "[{}] modify storage failed. cause: {}".format(resource["log_stream_id"], e))
+                      "[%s] modify storage failed. cause: %s", resource["log_stream_id"], e)
             raise
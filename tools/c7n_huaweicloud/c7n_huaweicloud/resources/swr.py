@@ -5,12 +5,14 @@ import logging
 import json
 import traceback
 import time
+from functools import partial
 
 from c7n.filters import Filter
-from c7n.filters.core import ValueFilter, AgeFilter
+from c7n.filters.core import ValueFilter
 from c7n.utils import local_session, type_schema
 
 from c7n_huaweicloud.actions.base import HuaweiCloudBaseAction
+from c7n_huaweicloud.filters.time import IsoDateAgeFilter
 from c7n_huaweicloud.provider import resources
 from c7n_huaweicloud.query import QueryResourceManager
 from c7n_huaweicloud.query import TypeInfo
@@ -25,6 +27,9 @@ from huaweicloudsdkswr.v2.model.tag_selector import TagSelector
 
 log = logging.getLogger('custodian.huaweicloud.swr')
 
+# repositories whose retention policies are fetched in parallel
+MAX_WORKERS = 5
+
 
 @resources.register('swr')
 class Swr(QueryResourceManager):
@@ -159,6 +164,13 @@ class LifecycleRule(Filter):
     )
     policy_annotation = 'c7n:lifecycle-policy'
 
+    def __init__(self, data, manager=None):
+        super().__init__(data, manager)
+        # The matchers only depend on the policy data, build them once
+        # instead of on every process call
+        self.params_filters = self.build_params_filters()
+        self.matchers = self.build_matchers()
+
     def process(self, resources, event=None):
         """Process resources based on lifecycle rule criteria.
 
@@ -170,28 +182,20 @@ class LifecycleRule(Filter):
         :return: Filtered resource list
         """
         client = local_session(self.manager.session_factory).client('swr')
-        # Lazily load lifecycle policies only when needed
-        for resource in resources:
-            # Skip if we've already loaded the lifecycle policy for this resource
-            if self.policy_annotation in resource:
-                continue
-
-            # Get lifecycle policy for this repository
-            try:
-                self._get_lifecycle_policy(client, resource)
-            except Exception as e:
-                log.warning(
-                    "Exception getting lifecycle policy for %s: %s",
-                    resource['name'], e)
-                resource[self.policy_annotation] = []
+        # Lazily load lifecycle policies only when needed, skipping resources
+        # whose policy is already loaded. Each lookup is one round trip, so
+        # they are fetched concurrently.
+        pending = [r for r in resources if self.policy_annotation not in r]
+        with self.executor_factory(max_workers=MAX_WORKERS) as w:
+            list(w.map(partial(self._load_lifecycle_policy, client), pending))
 
         state = self.data.get('state', True)
         results = []
 
         # Extract filter conditions
-        params_filters = self.build_params_filters()
+        params_filters = self.params_filters
         tag_selector = self.data.get('tag_selector')
-        matchers = self.build_matchers()
+        matchers = self.matchers
 
         for resource in resources:
             policies = resource.get(self.policy_annotation, [])
@@ -230,6 +234,16 @@ class LifecycleRule(Filter):
 
         return results
 
+    def _load_lifecycle_policy(self, client, resource):
+        """Get lifecycle policy for a repository, defaulting to none on error."""
+        try:
+            self._get_lifecycle_policy(client, resource)
+        except Exception as e:
+            log.warning(
+                "Exception getting lifecycle policy for %s: %s",
+                resource['name'], e)
+            resource[self.policy_annotation] = []
+
     def _get_lifecycle_policy(self, client, resource):
         """Get lifecycle policy for a specific repository.
 
@@ -457,20 +471,21 @@ class SwrImage(QueryResourceManager):
         limit = 100  # Default page size
         page_num = 0
 
+        # Build the request once per repository, only the offset changes per page
+        request = ListRepositoryTagsRequest(
+            namespace=namespace,
+            repository=repository,
+            limit=limit,
+            offset=offset
+        )
+
         try:
             while True:
                 # Add page counter for logging purposes
                 page_num += 1
 
-                # Build request with pagination parameters
-                request = ListRepositoryTagsRequest(
-                    namespace=namespace,
-                    repository=repository,
-                    limit=limit,
-                    offset=offset
-                )
-
                 # Execute request
+                request.offset = offset
                 response = client.list_repository_tags(request)
 
                 # Break if no results
@@ -528,7 +543,7 @@ class SwrImage(QueryResourceManager):
 
 
 @SwrImage.filter_registry.register('age')
-class SwrImageAgeFilter(AgeFilter):
+class SwrImageAgeFilter(IsoDateAgeFilter):
     """SWR Image creation time filter.
 
     :example:
@@ -556,7 +571,7 @@ class SwrImageAgeFilter(AgeFilter):
 
 
 @Swr.filter_registry.register('age')
-class SwrAgeFilter(AgeFilter):
+class SwrAgeFilter(IsoDateAgeFilter):
     """SWR Repository creation time filter.
 
     :example:
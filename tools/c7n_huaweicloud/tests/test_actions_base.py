@@ -0,0 +1,85 @@
+# Copyright The Cloud Custodian Authors.
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import patch
+
+from huaweicloud_common import BaseTest
+from huaweicloudsdkcore.exceptions import exceptions
+
+from c7n_huaweicloud.actions.base import (
+    HuaweiCloudBaseAction, is_idempotent_retryable_exception, is_retryable_exception)
+
+
+def error(exception_class, status_code):
+    return exception_class(
+        status_code, exceptions.SdkError("request-id", "SDK.%d" % status_code, "error"))
+
+
+class RetryableExceptionTest(BaseTest):
+
+    def test_gateway_errors_retryable(self):
+        for status_code in (502, 503):
+            self.assertTrue(is_retryable_exception(
+                error(exceptions.ServerResponseException, status_code)), status_code)
+
+    def test_gateway_timeout_retryable_only_if_idempotent(self):
+        gateway_timeout = error(exceptions.ServerResponseException, 504)
+        self.assertFalse(is_retryable_exception(gateway_timeout))
+        self.assertTrue(is_idempotent_retryable_exception(gateway_timeout))
+
+    def test_throttling_retryable(self):
+        self.assertTrue(is_retryable_exception(
+            error(exceptions.ClientRequestException, 429)))
+
+    def test_connection_error_retryable(self):
+        self.assertTrue(is_retryable_exception(exceptions.ConnectionException("reset")))
+
+    def test_internal_server_error_not_retryable(self):
+        self.assertFalse(is_retryable_exception(
+            error(exceptions.ServerResponseException, 500)))
+
+    def test_client_errors_not_retryable(self):
+        for status_code in (400, 401, 403, 404, 409):
+            self.assertFalse(is_retryable_exception(
+                error(exceptions.ClientRequestException, status_code)), status_code)
+
+    def test_other_errors_not_retryable(self):
+        self.assertFalse(is_retryable_exception(ValueError("bad value")))
+
+
+class Action(HuaweiCloudBaseAction):
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = errors
+        self.calls = 0
+
+    def perform_action(self, resource):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+class IdempotentAction(Action):
+    retry_server_errors = True
+
+
+class ProcessActionRetryTest(BaseTest):
+
+    def test_gateway_error_retried(self):
+        action = Action([error(exceptions.ServerResponseException, 503)])
+        with patch("retrying.time.sleep"):
+            action.process_action({"id": "resource-1"})
+        self.assertEqual(action.calls, 2)
+
+    def test_gateway_timeout_not_retried_by_default(self):
+        action = Action([error(exceptions.ServerResponseException, 504)])
+        with patch("retrying.time.sleep"):
+            with self.assertRaises(exceptions.ServerResponseException):
+                action.process_action({"id": "resource-1"})
+        self.assertEqual(action.calls, 1)
+
+    def test_gateway_timeout_retried_if_idempotent(self):
+        action = IdempotentAction([error(exceptions.ServerResponseException, 504)])
+        with patch("retrying.time.sleep"):
+            action.process_action({"id": "resource-1"})
+        self.assertEqual(action.calls, 2)
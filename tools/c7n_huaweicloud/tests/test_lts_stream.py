@@ -1,7 +1,12 @@
 # Copyright The Cloud Custodian Authors.
 # SPDX-License-Identifier: Apache-2.0
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
 from huaweicloud_common import BaseTest
 
+from c7n_huaweicloud.resources.stream import RateLimiter
+
 
 class StreamTest(BaseTest):
 
@@ -28,6 +33,35 @@ class StreamTest(BaseTest):
         self.assertEqual(len(resources), 2)
         self.assertEqual(resources[0]['log_stream_id'], "test-log-stream-id")
 
+    def test_stream_get_resources_early_exit(self):
+        factory = self.replay_flight_data('lts_stream_storage_enabled_filter')
+        p = self.load_policy({
+            'name': 'stream-by-id',
+            'resource': 'huaweicloud.lts-stream'},
+            session_factory=factory)
+        manager = p.resource_manager
+        resources = manager.get_resources(["test-log-stream-id"])
+        self.assertEqual(len(resources), 1)
+        self.assertEqual(resources[0]['log_group_id'], "test-log-group-id")
+
+        def group(i):
+            return SimpleNamespace(log_group_id="group-%d" % i, log_group_name="group-%d" % i)
+
+        def stream(i):
+            return SimpleNamespace(log_stream_id="stream-%d" % i, log_stream_name="stream-%d" % i,
+                                   whether_log_storage=True, tag={})
+
+        client = MagicMock()
+        client.list_log_groups.return_value.log_groups = [group(i) for i in range(4)]
+        client.list_log_stream.side_effect = [
+            SimpleNamespace(log_streams=[stream(i)]) for i in range(4)]
+        with patch.object(manager, "get_client", return_value=client), \
+                patch("c7n_huaweicloud.resources.stream.LTS_LIMITER"):
+            resources = manager.get_resources(["stream-1", "stream-0"])
+        self.assertEqual([r["id"] for r in resources], ["stream-0", "stream-1"])
+        # the groups after the one holding the last requested stream are not listed
+        self.assertEqual(client.list_log_stream.call_count, 2)
+
     def test_disable_stream_storage(self):
         factory = self.replay_flight_data('lts_disable_stream_storage')
         p = self.load_policy({
@@ -44,3 +78,13 @@ class StreamTest(BaseTest):
         self.assertEqual(len(resources), 2)
         self.assertEqual(resources[0]['log_group_id'], "test-log-group-id")
         self.assertEqual(resources[0]['log_stream_id'], "test-log-stream-id")
+
+    def test_rate_limiter_burst(self):
+        limiter = RateLimiter(rate=2, burst=2)
+        with patch("c7n_huaweicloud.resources.stream.time.sleep") as sleep:
+            limiter.acquire()
+            limiter.acquire()
+            sleep.assert_not_called()
+            limiter.acquire()
+            sleep.assert_called_once()
+            self.assertAlmostEqual(sleep.call_args[0][0], 0.5, places=1)
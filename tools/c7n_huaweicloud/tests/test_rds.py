@@ -1,7 +1,15 @@
 # Copyright The Cloud Custodian Authors.
 # SPDX-License-Identifier: Apache-2.0
 
+from unittest.mock import patch
+
+from c7n.exceptions import PolicyExecutionError
 from huaweicloud_common import BaseTest
+from huaweicloudsdkcore.exceptions import exceptions
+from huaweicloudsdkrds.v3 import InstanceResponse, ListInstancesResponse
+
+from c7n_huaweicloud.client import Session
+from c7n_huaweicloud.query import ResourceQuery
 
 
 # Note: Actual testing requires corresponding VCR files
@@ -36,6 +44,8 @@ class RDSTest(BaseTest):
         self.assertTrue("created" in instance)  # Verify 'created' field exists (for AgeFilter)
         # Verify 'datastore' field exists (for DatabaseVersionFilter)
         self.assertTrue("datastore" in instance)
+        # Verify the engine is normalized once during augment
+        self.assertEqual(instance["c7n:engine"], instance["datastore"]["type"].lower())
         self.assertTrue("port" in instance)  # Verify 'port' field exists (for DatabasePortFilter)
         # Verify 'ssl_enable' field exists (for SSLInstanceFilter)
         self.assertTrue("enable_ssl" in instance)
@@ -45,6 +55,142 @@ class RDSTest(BaseTest):
         # Verify 'public_ips' exists, for EIPFilter
         self.assertTrue("public_ips" in instance)
 
+    def test_rds_client_reused(self):
+        """Test the RDS client is built once for the filters and actions of a policy"""
+        factory = self.replay_flight_data("rds_query")
+        p = self.load_policy(
+            {
+                "name": "rds-client-reused-test",
+                "resource": "huaweicloud.rds",
+                "actions": [{
+                    "type": "update-instance-parameter",
+                    "parameters": [
+                        {"name": "max_connections", "value": "1000"}
+                    ]
+                }],
+            },
+            session_factory=factory,
+        )
+        manager = p.resource_manager
+        action = manager.actions[0]
+        resources = [{"id": "rds-%d" % i, "name": "rds-%d" % i} for i in range(5)]
+        with patch.object(Session, "client") as session_client:
+            # a filter stage asks the manager for the client first
+            client = manager.get_client()
+            action.process(resources)
+        session_client.assert_called_once_with("rds")
+        self.assertEqual(client.update_instance_configuration.call_count, 5)
+
+    def test_rds_server_side_filters(self):
+        """Test equality value filters are pushed down to list_instances"""
+        factory = self.replay_flight_data("rds_query")
+        p = self.load_policy(
+            {
+                "name": "rds-server-side-filters-test",
+                "resource": "huaweicloud.rds",
+                "filters": [
+                    {"vpc_id": "vpc-1"},
+                    {"type": "value", "key": "datastore.type", "value": "MySQL"},
+                    {"type": "value", "key": "name", "value": "rds", "op": "glob"},
+                    {"type": "value", "key": "subnet_id", "value": "absent"},
+                    {"type": "value", "key": "status", "value": "ACTIVE"},
+                ],
+            },
+            session_factory=factory,
+        )
+        query = p.resource_manager.get_resource_query()
+        self.assertEqual(
+            query["request_params"], {"vpc_id": "vpc-1", "datastore_type": "MySQL"})
+
+    def test_rds_server_side_filters_skip_transforms(self):
+        """Test value filters with transforms are not pushed down"""
+        factory = self.replay_flight_data("rds_query")
+        p = self.load_policy(
+            {
+                "name": "rds-server-side-filters-skip-test",
+                "resource": "huaweicloud.rds",
+                "filters": [
+                    {"type": "value", "key": "datastore.type",
+                     "value_regex": "^(\\w+)", "value": "MySQL"},
+                    {"type": "value", "key": "vpc_id",
+                     "value_from": {"url": "s3://bucket/vpcs.txt"}, "value": "vpc-1"},
+                    {"type": "value", "key": "name", "value": "rds", "value_type": "normalize"},
+                    {"type": "value", "key": "id", "value": "rds-1", "op": "eq",
+                     "value_path": "id"},
+                ],
+            },
+            session_factory=factory,
+            validate=False,
+        )
+        self.assertEqual(p.resource_manager.get_request_params(), {})
+        self.assertNotIn("request_params", p.resource_manager.get_resource_query() or {})
+
+    def test_rds_server_side_filters_skip_resource_limits(self):
+        """Test resource limits are checked against the unfiltered population"""
+        factory = self.replay_flight_data("rds_filter_list")
+        p = self.load_policy(
+            {
+                "name": "rds-server-side-filters-limit-test",
+                "resource": "huaweicloud.rds",
+                "filters": [{"id": "rds-list-filter-id-1"}],
+                "max-resources-percent": 50,
+            },
+            session_factory=factory,
+        )
+        self.assertEqual(p.resource_manager.get_request_params(), {})
+        # 1 of 3 instances, a listing filtered by id would count 1 of 1
+        resources = p.run()
+        self.assertEqual(len(resources), 1)
+        p = self.load_policy(
+            {
+                "name": "rds-server-side-filters-max-resources-test",
+                "resource": "huaweicloud.rds",
+                "filters": [{"id": "rds-list-filter-id-1"}],
+                "max-resources": 1,
+            },
+            session_factory=factory,
+        )
+        self.assertEqual(p.resource_manager.get_request_params(), {})
+
+    def test_rds_query_concurrent_pages(self):
+        """Test pages after the first are fetched concurrently using total_count"""
+        total_count = 250
+
+        def list_instances(client, enum_op, request):
+            ids = range(request.offset, min(request.offset + request.limit, total_count))
+            return ListInstancesResponse(
+                instances=[InstanceResponse(id="rds-%d" % i, name="rds-%d" % i) for i in ids],
+                total_count=total_count)
+
+        factory = self.replay_flight_data("rds_query")
+        p = self.load_policy(
+            {
+                "name": "rds-query-concurrent-pages-test",
+                "resource": "huaweicloud.rds",
+            },
+            session_factory=factory,
+        )
+        with patch.object(ResourceQuery, "_invoke_client_enum",
+                          side_effect=list_instances) as invoke:
+            resources = p.run()
+        self.assertEqual(invoke.call_count, 3)
+        self.assertEqual([r["id"] for r in resources],
+                         ["rds-%d" % i for i in range(total_count)])
+
+    def test_rds_cache_key_region(self):
+        """Test the resource cache key is scoped to the policy region"""
+        factory = self.replay_flight_data("rds_query")
+        p = self.load_policy(
+            {
+                "name": "rds-cache-key-region-test",
+                "resource": "huaweicloud.rds",
+            },
+            session_factory=factory,
+        )
+        key = p.resource_manager.get_cache_key(None)
+        self.assertEqual(key["region"], p.options.region)
+        self.assertEqual(key["service"], "rds")
+
     # =========================
     # Filter Tests
     # =========================
@@ -119,6 +265,20 @@ class RDSTest(BaseTest):
             self.assertTrue("complete_version" in resource["datastore"]
                             or "version" in resource["datastore"])
 
+    def test_rds_filter_db_version_no_resources(self):
+        """Test db-version-upgrade-check filter - no API call without resources"""
+        # rds_query.yaml has no list_datastores record, an API call would fail here
+        factory = self.replay_flight_data("rds_query")
+        p = self.load_policy(
+            {
+                "name": "rds-filter-db-version-empty-test",
+                "resource": "huaweicloud.rds",
+                "filters": [{"type": "db-version-upgrade-check", "database_name": "mysql"}],
+            },
+            session_factory=factory,
+        )
+        self.assertEqual(p.resource_manager.filters[0].process([]), [])
+
     def test_rds_filter_eip_exists(self):
         """Test eip filter - EIP exists"""
         factory = self.replay_flight_data("rds_filter_eip")
@@ -193,6 +353,23 @@ class RDSTest(BaseTest):
                            "Test VCR file should contain RDS instances with backup policy disabled")
         # The VCR file for testing should contain calls and responses to the show_backup_policy API
 
+    def test_rds_filter_backup_policy_disabled_duplicates(self):
+        """Test backup-policy-disabled filter - duplicate resources are matched once"""
+        factory = self.replay_flight_data("rds_filter_backup_policy_disabled")
+        p = self.load_policy(
+            {
+                "name": "rds-filter-backup-policy-disabled-duplicates-test",
+                "resource": "huaweicloud.rds",
+                "filters": [{"type": "backup-policy-disabled"}],
+            },
+            session_factory=factory,
+        )
+        resources = p.run()
+        self.assertGreater(len(resources), 0)
+        backup_filter = p.resource_manager.filters[0]
+        matched = backup_filter.process(resources + resources)
+        self.assertEqual(len(matched), len(resources))
+
     def test_rds_filter_instance_parameter_eq(self):
         """Test instance-parameter filter - equal (eq)"""
         factory = self.replay_flight_data("rds_filter_instance_parameter")
@@ -605,6 +782,65 @@ class RDSTest(BaseTest):
         # Confirm PUT /v3/{project_id}/instances/{instance_id}/configurations is called
         # And the request body contains the correct parameters
 
+    def test_rds_action_update_instance_parameter_max_workers(self):
+        """Test update-instance-parameter action - bounded concurrency"""
+        factory = self.replay_flight_data("rds_action_update_instance_parameter")
+        p = self.load_policy(
+            {
+                "name": "rds-action-update-instance-parameter-workers-test",
+                "resource": "huaweicloud.rds",
+                "filters": [{"id": "rds-instance-for-parameter-update"}],
+                "actions": [{
+                    "type": "update-instance-parameter",
+                    "max_workers": 2,
+                    "parameters": [
+                        {"name": "max_connections", "value": "1000"}
+                    ]
+                }],
+            },
+            session_factory=factory,
+        )
+        resources = p.run()
+        self.assertEqual(len(resources), 1)
+
+    def test_rds_action_failures_aggregated(self):
+        """Test a failing instance does not stop the other instances"""
+        factory = self.replay_flight_data("rds_action_update_instance_parameter")
+        p = self.load_policy(
+            {
+                "name": "rds-action-failures-aggregated-test",
+                "resource": "huaweicloud.rds",
+                "actions": [{
+                    "type": "update-instance-parameter",
+                    "max_workers": 2,
+                    "parameters": [
+                        {"name": "max_connections", "value": "1000"}
+                    ]
+                }],
+            },
+            session_factory=factory,
+        )
+        action = p.resource_manager.actions[0]
+        resources = [{"id": "rds-%d" % i} for i in range(4)]
+        processed = []
+
+        def perform_action(resource):
+            processed.append(resource["id"])
+            if resource["id"] == "rds-1":
+                raise exceptions.ServerResponseException(
+                    500, exceptions.SdkError("request-id", "RDS.0500", "internal error"))
+            if resource["id"] == "rds-2":
+                raise ValueError("unexpected response")
+
+        with patch.object(p.resource_manager, "get_client"), \
+                patch.object(action, "perform_action", side_effect=perform_action):
+            with self.assertRaises(PolicyExecutionError) as ctx:
+                action.process(resources)
+        self.assertEqual(sorted(processed), ["rds-0", "rds-1", "rds-2", "rds-3"])
+        self.assertIn("rds-1", str(ctx.exception))
+        self.assertIn("rds-2", str(ctx.exception))
+        self.assertNotIn("rds-0", str(ctx.exception))
+
     def test_postgresql_hba_conf_filter_match(self):
         """Test pg_hba.conf configuration filter - match specific configuration"""
         factory = self.replay_flight_data("rds_postgresql_hba_conf_match")
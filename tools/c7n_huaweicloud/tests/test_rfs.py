@@ -0,0 +1,88 @@
+# Copyright The Cloud Custodian Authors.
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import MagicMock, patch
+
+from huaweicloud_common import BaseTest
+from huaweicloudsdkcore.exceptions import exceptions
+
+
+def stack(stack_id):
+    return {"id": stack_id, "stack_id": stack_id, "stack_name": "name-%s" % stack_id}
+
+
+def metadata(request):
+    response = MagicMock()
+    response.to_dict.return_value = {
+        "stack_id": request.stack_id, "stack_name": request.stack_name}
+    return response
+
+
+def error(status_code):
+    return exceptions.ClientRequestException(
+        status_code, exceptions.SdkError("request-id", "AOS.%d" % status_code, "error"))
+
+
+class StackTest(BaseTest):
+
+    def load_stack_policy(self):
+        return self.load_policy({
+            'name': 'rfs-stacks',
+            'resource': 'huaweicloud.rfs-stack'})
+
+    def test_stack_augment_keeps_order(self):
+        manager = self.load_stack_policy().resource_manager
+        client = MagicMock()
+        client.get_stack_metadata.side_effect = metadata
+        with patch.object(manager, "get_client", return_value=client):
+            resources = manager.augment([stack("stack-%d" % i) for i in range(6)])
+        self.assertEqual([r["id"] for r in resources], ["stack-%d" % i for i in range(6)])
+        self.assertEqual(client.get_stack_metadata.call_count, 6)
+
+    def test_stack_augment_failure_propagates(self):
+        manager = self.load_stack_policy().resource_manager
+
+        def get_stack_metadata(request):
+            if request.stack_id == "stack-1":
+                raise error(400)
+            return metadata(request)
+
+        client = MagicMock()
+        client.get_stack_metadata.side_effect = get_stack_metadata
+        with patch.object(manager, "get_client", return_value=client):
+            with self.assertRaises(exceptions.ClientRequestException):
+                manager.augment([stack("stack-%d" % i) for i in range(3)])
+
+    def test_stack_metadata_not_found(self):
+        manager = self.load_stack_policy().resource_manager
+
+        def get_stack_metadata(request):
+            if request.stack_id == "stack-1":
+                raise error(404)
+            return metadata(request)
+
+        client = MagicMock()
+        client.get_stack_metadata.side_effect = get_stack_metadata
+        with patch.object(manager, "get_client", return_value=client):
+            resources = manager.augment([stack("stack-%d" % i) for i in range(3)])
+        # a stack deleted after it was listed is dropped
+        self.assertEqual([r["id"] for r in resources], ["stack-0", "stack-2"])
+
+    def test_stack_metadata_throttled_retry(self):
+        manager = self.load_stack_policy().resource_manager
+        throttles = [error(429), error(429)]
+
+        def get_stack_metadata(request):
+            if throttles:
+                raise throttles.pop(0)
+            return metadata(request)
+
+        client = MagicMock()
+        client.get_stack_metadata.side_effect = get_stack_metadata
+        with patch("retrying.time.sleep") as sleep, \
+                patch("c7n_huaweicloud.resources.rfs.log") as log:
+            resource = manager.get_stack_metadata(client, stack("stack-0"))
+        self.assertEqual(resource["id"], "stack-0")
+        self.assertEqual(client.get_stack_metadata.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+        # the throttled attempts are retried without logging an error
+        log.error.assert_not_called()
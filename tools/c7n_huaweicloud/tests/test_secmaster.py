@@ -1,7 +1,11 @@
 # Copyright The Cloud Custodian Authors.
 # SPDX-License-Identifier: Apache-2.0
 
+from unittest.mock import MagicMock
+
+from dateutil.parser import parse
 from huaweicloud_common import BaseTest
+from huaweicloudsdkcore.exceptions import exceptions
 
 
 class SecmasterTest(BaseTest):
@@ -49,6 +53,40 @@ class SecmasterTest(BaseTest):
         self.assertEqual(workspace2["description"], "测试环境工作空间")
         self.assertFalse(workspace2["is_view"])
 
+    def test_secmaster_workspace_cache_key(self):
+        """Test workspace and alert listings are cached under different keys"""
+        factory = self.replay_flight_data("secmaster_alert_query")
+        p = self.load_policy(
+            {
+                "name": "secmaster-alert-cache-key-test",
+                "resource": "huaweicloud.secmaster-alert",
+            },
+            session_factory=factory,
+        )
+        workspace_manager = p.resource_manager.get_resource_manager(
+            "huaweicloud.secmaster-workspace")
+        self.assertNotEqual(
+            p.resource_manager.get_cache_key(None), workspace_manager.get_cache_key(None))
+
+    def test_secmaster_alert_age_resource_date(self):
+        """Test alert age parsing of ISO and non-ISO creation times"""
+        factory = self.replay_flight_data("secmaster_alert_query")
+        p = self.load_policy(
+            {
+                "name": "secmaster-alert-age-date-test",
+                "resource": "huaweicloud.secmaster-alert",
+                "filters": [{"type": "age", "days": 7, "op": "lt"}],
+            },
+            session_factory=factory,
+        )
+        age = p.resource_manager.filters[0]
+        self.assertEqual(
+            age.get_resource_date({"create_time": "2024-07-02T10:00:00Z"}),
+            parse("2024-07-02T10:00:00Z"))
+        self.assertEqual(
+            age.get_resource_date({"create_time": "2024-07-02T10:00:00Z+0800"}),
+            parse("2024-07-02T10:00:00Z+0800"))
+
     def test_secmaster_alert_query(self):
         """Test SecMaster alert query"""
         factory = self.replay_flight_data("secmaster_alert_query")
@@ -512,3 +550,40 @@ class SecmasterErrorHandlingTest(BaseTest):
             0,
             "Should return empty playbook list when no workspace exists",
         )
+
+    # =========================
+    # Listing Error Tests
+    # =========================
+
+    def assert_listing_errors(self, resource, method, fetch):
+        p = self.load_policy({"name": "secmaster-listing-errors", "resource": resource})
+        manager = p.resource_manager
+        workspace = {"id": "workspace-id", "name": "workspace"}
+
+        def client_raising(error):
+            client = MagicMock()
+            getattr(client, method).side_effect = error
+            return client
+
+        def sdk_error(status_code):
+            return exceptions.ClientRequestException(
+                status_code, exceptions.SdkError("request-id", "SecMaster.%d" % status_code,
+                                                 "resource not exist"))
+
+        # a workspace without resources is skipped
+        self.assertEqual(getattr(manager, fetch)(client_raising(sdk_error(404)), workspace), [])
+        # authentication, permission and unknown errors abort the listing
+        for error in (sdk_error(401), sdk_error(403), sdk_error(400),
+                      ValueError("resource not exist")):
+            with self.assertRaises(type(error)):
+                getattr(manager, fetch)(client_raising(error), workspace)
+
+    def test_secmaster_alert_listing_errors(self):
+        """Test which alert listing errors skip the workspace and which abort"""
+        self.assert_listing_errors(
+            "huaweicloud.secmaster-alert", "list_alerts", "_fetch_workspace_alerts")
+
+    def test_secmaster_playbook_listing_errors(self):
+        """Test which playbook listing errors skip the workspace and which abort"""
+        self.assert_listing_errors(
+            "huaweicloud.secmaster-playbook", "list_playbooks", "_fetch_workspace_playbooks")
@@ -2,8 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
+from dateutil.parser import parse
+from dateutil.tz import tzutc
 from huaweicloud_common import BaseTest
+from huaweicloudsdkcore.exceptions import exceptions
 
 
 class SwrRepositoryTest(BaseTest):
@@ -70,6 +74,30 @@ class SwrRepositoryTest(BaseTest):
             resources[0]["created_at"], "%Y-%m-%dT%H:%M:%SZ")
         self.assertTrue((datetime.now() - created_date).days > 90)
 
+    def test_swr_filter_age_resource_date(self):
+        """Test SWR age filter parsing of ISO and non-ISO creation times."""
+        p = self.load_policy(
+            {
+                "name": "swr-filter-age-date",
+                "resource": "huaweicloud.swr",
+                "filters": [{"type": "age", "days": 90, "op": "gt"}],
+            },
+        )
+        age = p.resource_manager.filters[0]
+        # ISO-8601 values are read by fromisoformat
+        with patch("c7n.filters.core.parse") as dateutil_parse:
+            self.assertEqual(
+                age.get_resource_date({"created_at": "2023-01-01T08:30:00Z"}),
+                datetime(2023, 1, 1, 8, 30, tzinfo=tzutc()))
+            self.assertEqual(
+                age.get_resource_date({"created_at": "2023-01-01T08:30:00.123+08:00"}),
+                parse("2023-01-01T08:30:00.123+08:00"))
+            dateutil_parse.assert_not_called()
+        # other formats fall back to the dateutil parser
+        self.assertEqual(
+            age.get_resource_date({"created_at": "Jan 1 2023 08:30:00 UTC"}),
+            datetime(2023, 1, 1, 8, 30, tzinfo=tzutc()))
+
 
 class SwrImageTest(BaseTest):
     """Test SWR Image resources, filters, and actions."""
@@ -215,6 +243,39 @@ class LifecycleRuleFilterTest(BaseTest):
         self.assertTrue(isinstance(lifecycle_policy, list))
         self.assertEqual(len(lifecycle_policy), 0)
 
+    def test_lifecycle_rule_filter_lookup_failure(self):
+        """Test a failed lifecycle lookup defaults to no rules without stopping others."""
+        p = self.load_policy(
+            {
+                "name": "swr-filter-lifecycle-rule-failure",
+                "resource": "huaweicloud.swr",
+                "filters": [{"type": "lifecycle-rule", "state": False}],
+            },
+        )
+        lifecycle_filter = p.resource_manager.filters[0]
+
+        def list_retentions(request):
+            if request.repository == "repo-1":
+                raise exceptions.ServerResponseException(
+                    500, exceptions.SdkError("request-id", "SWR.0500", "internal error"))
+            retention = MagicMock()
+            retention.to_dict.return_value = {"id": request.repository, "rules": []}
+            return MagicMock(body=[retention])
+
+        client = MagicMock()
+        client.list_retentions.side_effect = list_retentions
+        resources = [{"name": "repo-%d" % i, "namespace": "ns"} for i in range(4)]
+        with patch("c7n_huaweicloud.resources.swr.local_session") as local_session:
+            local_session.return_value.client.return_value = client
+            results = lifecycle_filter.process(resources)
+
+        self.assertEqual(client.list_retentions.call_count, 4)
+        self.assertEqual([r["name"] for r in results], ["repo-1"])
+        self.assertEqual(resources[1]["c7n:lifecycle-policy"], [])
+        for i in (0, 2, 3):
+            self.assertEqual(resources[i]["c7n:lifecycle-policy"],
+                             [{"id": "repo-%d" % i, "rules": []}])
+
 
 class SetLifecycleActionTest(BaseTest):
     """Test SWR Set Lifecycle Rule actions."""
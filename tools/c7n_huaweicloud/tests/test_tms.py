@@ -0,0 +1,85 @@
+# Copyright The Cloud Custodian Authors.
+# SPDX-License-Identifier: Apache-2.0
+import threading
+from unittest.mock import MagicMock, patch
+
+from huaweicloud_common import BaseTest
+from huaweicloudsdkcore.exceptions import exceptions
+
+from c7n_huaweicloud.actions.tms import RESOURCE_MAX_SIZE
+
+
+def error(exception_class, status_code):
+    return exception_class(
+        status_code, exceptions.SdkError("request-id", "TMS.%d" % status_code, "error"))
+
+
+class TmsBatchTest(BaseTest):
+
+    def run_batches(self, action_data, method, failing_id=None, failure=None):
+        p = self.load_policy({
+            'name': 'tms-batches',
+            'resource': 'huaweicloud.rds',
+            'actions': [action_data]})
+        action = p.resource_manager.actions[0]
+        prefix = "%s-%s" % (action_data["type"], failure.status_code if failure else "ok")
+        resources = [{"id": "%s-%d" % (prefix, i), "tag_resource_type": "rds"}
+                     for i in range(RESOURCE_MAX_SIZE * 2 + 20)]
+        batches = []
+        lock = threading.Lock()
+
+        def send(request):
+            ids = [r["resource_id"] for r in request.body.resources]
+            with lock:
+                batches.append(ids)
+            if failing_id and "%s-%d" % (prefix, failing_id) in ids:
+                raise failure
+            return MagicMock(failed_resources=[])
+
+        client = MagicMock()
+        getattr(client, method).side_effect = send
+        with patch.object(action, "get_project_id", return_value="project-id"), \
+                patch.object(action, "get_tag_client", return_value=client):
+            result = action.process(resources)
+        return resources, batches, result
+
+    def assert_every_batch_sent(self, resources, batches):
+        self.assertEqual(sorted(len(b) for b in batches),
+                         [20, RESOURCE_MAX_SIZE, RESOURCE_MAX_SIZE])
+        self.assertEqual(sorted(i for b in batches for i in b),
+                         sorted(r["id"] for r in resources))
+
+    def test_tag_batches(self):
+        resources, batches, result = self.run_batches(
+            {"type": "tag", "key": "owner", "value": "c7n"}, "create_resource_tag")
+        self.assert_every_batch_sent(resources, batches)
+        for r in resources:
+            self.assertIn(r["id"], result["succeeded_resources"])
+
+    def test_remove_tag_batches(self):
+        resources, batches, result = self.run_batches(
+            {"type": "remove-tag", "tags": ["owner"]}, "delete_resource_tag")
+        self.assert_every_batch_sent(resources, batches)
+        for r in resources:
+            self.assertIn(r["id"], result["succeeded_resources"])
+
+    def test_tag_failed_batch_recorded(self):
+        resources, batches, result = self.run_batches(
+            {"type": "tag", "key": "owner", "value": "c7n"}, "create_resource_tag",
+            failing_id=60, failure=error(exceptions.ClientRequestException, 400))
+        self.assert_every_batch_sent(resources, batches)
+        failed_ids = {r["resource_id"] for r in result["failed_resources"]}
+        # the whole second batch is reported as failed, the others succeed
+        for i, r in enumerate(resources):
+            if RESOURCE_MAX_SIZE <= i < RESOURCE_MAX_SIZE * 2:
+                self.assertIn(r["id"], failed_ids)
+                self.assertNotIn(r["id"], result["succeeded_resources"])
+            else:
+                self.assertIn(r["id"], result["succeeded_resources"])
+
+    def test_remove_tag_failed_batch_propagates(self):
+        with patch("retrying.time.sleep"):
+            with self.assertRaises(exceptions.ServerResponseException):
+                self.run_batches(
+                    {"type": "remove-tag", "tags": ["owner"]}, "delete_resource_tag",
+                    failing_id=60, failure=error(exceptions.ServerResponseException, 500))